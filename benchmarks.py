@@ -0,0 +1,193 @@
+import argparse
+import os
+import re
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import import_peertube
+import import_transcripts
+import inverted_index
+import peertube_standin
+
+
+def parse_srt_pysrt(srt_file, vod_id):
+    # the importer before read_srt, kept as the baseline
+    import pysrt
+
+    subtitles = pysrt.open(srt_file)
+
+    pattern = r"\[\w+_(\d+)\]: (.+)"
+    records = []
+
+    for index, subtitle in enumerate(subtitles):
+        match = re.match(pattern, subtitle.text)
+        if match:
+            speaker_id = match.group(1)
+            content = match.group(2)
+        else:
+            speaker_id = 99
+            content = subtitle.text
+
+        records.append((vod_id, index + 1, speaker_id, subtitle.start.ordinal, subtitle.end.ordinal, content))
+    return records
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def consume(records):
+    count = 0
+    for _ in records:
+        count += 1
+    return count
+
+
+def bench_srt(args):
+    files = sorted(args.transcripts.glob("*.srt"))[: args.limit]
+    totals = {"pysrt": [0.0, 0], "read_srt": [0.0, 0]}
+    for file in files:
+        vod_id = import_transcripts.parse_srt_filename(file)[0]
+        expected, pysrt_time, pysrt_peak = measure(parse_srt_pysrt, file, vod_id)
+        count, stream_time, stream_peak = measure(consume, import_transcripts.read_srt(file, vod_id))
+        if list(import_transcripts.read_srt(file, vod_id)) != expected:
+            print(f"{file.name}: read_srt output differs from pysrt")
+        print(
+            f"{file.name}: {file.stat().st_size / 1024 / 1024:.1f} MB, {count} cues, "
+            f"pysrt {pysrt_time:.2f}s / {pysrt_peak / 1024 / 1024:.1f} MB peak, "
+            f"read_srt {stream_time:.2f}s / {stream_peak / 1024 / 1024:.1f} MB peak"
+        )
+        totals["pysrt"][0] += pysrt_time
+        totals["pysrt"][1] = max(totals["pysrt"][1], pysrt_peak)
+        totals["read_srt"][0] += stream_time
+        totals["read_srt"][1] = max(totals["read_srt"][1], stream_peak)
+
+    for name, (elapsed, peak) in totals.items():
+        print(f"{name}: {elapsed:.2f}s total, {peak / 1024 / 1024:.1f} MB max peak")
+
+
+def sync_legacy(conn, videos, imports):
+    # per-import linear scan, per-video select and write, one commit each
+    for import_data in imports:
+        matching_video = next((v for v in videos if v["id"] == import_data["video"]["id"]), None)
+        if matching_video:
+            matching_video["source_url"] = import_data["targetUrl"]
+    cursor = conn.cursor()
+    for video in videos:
+        cursor.execute("SELECT original_filename, external_id FROM peertube_videos WHERE id = ?", (video["id"],))
+        cursor.fetchone()
+        cursor.execute("SELECT manual_id FROM peertube_videos WHERE id = ?", (video["id"],))
+        cursor.fetchone()
+        import_peertube.upsert_videos(conn, [video], {})
+        conn.commit()
+
+
+def sync_indexed(conn, videos, imports):
+    existing = import_peertube.load_existing_videos(conn)
+    videos_by_id = {str(video["id"]): video for video in videos}
+    for import_data in imports:
+        matching_video = videos_by_id.get(str(import_data["video"]["id"]))
+        if matching_video:
+            matching_video["source_url"] = import_data["targetUrl"]
+    for video in videos:
+        video["original_filename"] = video["filename"]
+    import_peertube.save_videos(conn, videos, existing)
+
+
+def bench_sync(args):
+    for size in args.sizes:
+        catalog = peertube_standin.make_catalog(size)
+        imports = [{"video": {"id": video["id"]}, "targetUrl": f"https://www.twitch.tv/videos/v{video['id']}"} for video in catalog[::2]]
+        for name, func in (("legacy", sync_legacy), ("indexed", sync_indexed)):
+            if name == "legacy" and size > args.legacy_limit:
+                print(f"{size} videos, {name}: skipped (--legacy-limit {args.legacy_limit})")
+                continue
+            with tempfile.TemporaryDirectory() as tmp:
+                cwd = os.getcwd()
+                os.chdir(tmp)
+                try:
+                    conn = import_peertube.create_database()
+                    videos = [dict(video) for video in catalog]
+                    start = time.perf_counter()
+                    func(conn, videos, imports)
+                    elapsed = time.perf_counter() - start
+                    conn.close()
+                finally:
+                    os.chdir(cwd)
+            print(f"{size} videos, {name}: {elapsed:.2f}s ({size / elapsed:.0f} videos/s)")
+
+
+def table_bytes(cursor, table):
+    # a like '%term%' scan reads every page of the table
+    try:
+        cursor.execute("SELECT sum(pgsize) FROM dbstat WHERE name = ?", (table,))
+        return cursor.fetchone()[0]
+    except sqlite3.OperationalError:
+        cursor.execute("pragma page_size")
+        page_size = cursor.fetchone()[0]
+        cursor.execute("pragma page_count")
+        return page_size * cursor.fetchone()[0]
+
+
+def bench_index(args):
+    connection = sqlite3.connect(args.db)
+    cursor = connection.cursor()
+    scan_bytes = table_bytes(cursor, "transcripts")
+
+    if args.manifest is None:
+        args.manifest = inverted_index.write_inverted_index(args.db, args.index_dir)
+
+    mismatches = inverted_index.check_parity(cursor, inverted_index.InvertedIndex(args.index_dir, args.manifest), args.queries)
+    if mismatches:
+        print(f"Results differ from the SQLite search for: {', '.join(mismatches)}")
+
+    for query in args.queries:
+        start = time.perf_counter()
+        like_rows = import_transcripts.search_transcripts(cursor, query, use_fts=False)
+        like_time = time.perf_counter() - start
+
+        # a fresh index per query, like a client that has nothing cached yet
+        index = inverted_index.InvertedIndex(args.index_dir, args.manifest)
+        start = time.perf_counter()
+        index_rows = index.search(query)
+        index_time = time.perf_counter() - start
+
+        print(
+            f"{query!r}: like {len(like_rows)} rows, {scan_bytes / 1024:.0f} KB, {like_time * 1000:.1f} ms | "
+            f"index {len(index_rows)} rows, {index.bytes_read / 1024:.0f} KB, {index_time * 1000:.1f} ms"
+        )
+    connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(required=True)
+
+    srt_parser = subparsers.add_parser("srt", help="read_srt against the old pysrt importer")
+    srt_parser.add_argument("--transcripts", type=Path, default=Path(R"D:\Downloads\joe\transcripts"))
+    srt_parser.add_argument("--limit", type=int, default=None)
+    srt_parser.set_defaults(func=bench_srt)
+
+    sync_parser = subparsers.add_parser("sync", help="peertube sync matching and writes on a synthetic catalog")
+    sync_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 50000])
+    sync_parser.add_argument("--legacy-limit", type=int, default=5000, help="largest catalog to run the per-row path on")
+    sync_parser.set_defaults(func=bench_sync)
+
+    index_parser = subparsers.add_parser("index", help="static inverted index against like '%%term%%' on the publish database")
+    index_parser.add_argument("--db", default="publish.db")
+    index_parser.add_argument("--index-dir", default="static/index")
+    index_parser.add_argument("--manifest", default=None, help="existing manifest in --index-dir, built from --db when left out")
+    index_parser.add_argument("queries", nargs="*", default=["the", "game", "elden ring", "souls", "xylophone"])
+    index_parser.set_defaults(func=bench_index)
+
+    args = parser.parse_args()
+    args.func(args)
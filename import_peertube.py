@@ -1,15 +1,42 @@
+import argparse
 import requests
-import json
 import sqlite3
 import re
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm.auto import tqdm
 from dotenv import load_dotenv
 import os
 
+import reconcile
+
+MAX_WORKERS = 8
+
+
+def create_session(max_workers=MAX_WORKERS):
+    # keep-alive connections shared by all threads, retrying rate limits and server errors with backoff
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+session = create_session()
+
 
 def get_client_credentials(instance_url):
     client_url = f"{instance_url}/api/v1/oauth-clients/local"
-    response = requests.get(client_url)
+    response = session.get(client_url)
     response.raise_for_status()
     data = response.json()
     return data["client_id"], data["client_secret"]
@@ -18,7 +45,7 @@ def get_client_credentials(instance_url):
 def get_user_token(instance_url, client_id, client_secret, username, password):
     token_url = f"{instance_url}/api/v1/users/token"
     data = {"client_id": client_id, "client_secret": client_secret, "grant_type": "password", "response_type": "code", "username": username, "password": password}
-    response = requests.post(token_url, data=data)
+    response = session.post(token_url, data=data)
     response.raise_for_status()
     return response.json()["access_token"]
 
@@ -27,17 +54,17 @@ def get_peertube_videos(instance_url, access_token, start=0, count=30):
     headers = {"Authorization": f"Bearer {access_token}"}
     api_url = f"{instance_url}/api/v1/videos"
     params = {"start": start, "count": count, "sort": "-createdAt", "include": 1}
-    response = requests.get(api_url, params=params, headers=headers)
+    response = session.get(api_url, params=params, headers=headers)
     response.raise_for_status()
     data = response.json()
-    return data["data"]
+    return data["data"], data["total"]
 
 
 def get_video_source(instance_url, video_id, access_token):
     api_url = f"{instance_url}/api/v1/videos/{video_id}/source"
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        response = requests.get(api_url, headers=headers)
+        response = session.get(api_url, headers=headers)
         response.raise_for_status()
         data = response.json()
         return data.get("filename", None)
@@ -48,7 +75,8 @@ def get_video_source(instance_url, video_id, access_token):
             raise
 
 
-def get_user_imports(instance_url, access_token):
+def get_user_imports(instance_url, access_token, known_ids=None):
+    # imports are listed newest first, once we hit one we already have the rest are known too
     api_url = f"{instance_url}/api/v1/users/me/videos/imports"
     headers = {"Authorization": f"Bearer {access_token}"}
     all_imports = []
@@ -56,8 +84,8 @@ def get_user_imports(instance_url, access_token):
     count = 30
 
     while True:
-        params = {"start": start, "count": count}
-        response = requests.get(api_url, headers=headers, params=params)
+        params = {"start": start, "count": count, "sort": "-createdAt"}
+        response = session.get(api_url, headers=headers, params=params)
         response.raise_for_status()
         data = response.json()
         imports = data["data"]
@@ -65,7 +93,13 @@ def get_user_imports(instance_url, access_token):
         if not imports:
             break
 
-        all_imports.extend(imports)
+        if known_ids:
+            new_imports = [import_data for import_data in imports if str(import_data["video"]["id"]) not in known_ids]
+            all_imports.extend(new_imports)
+            if len(new_imports) < len(imports):
+                break
+        else:
+            all_imports.extend(imports)
         start += count
 
         if len(imports) < count:
@@ -74,35 +108,122 @@ def get_user_imports(instance_url, access_token):
     return all_imports
 
 
-def get_all_videos(instance_url, access_token, conn):
-    cursor = conn.cursor()
-    all_videos = []
+def list_changed_videos(instance_url, access_token, since_created, since_updated, count=30):
+    # videos are listed newest first, so we can stop at the first one that is older than both watermarks
+    changed_videos = []
     start = 0
-    count = 30
-
     while True:
-        videos = get_peertube_videos(instance_url, access_token, start=start, count=count)
-        if not videos:
-            break
+        videos, total = get_peertube_videos(instance_url, access_token, start=start, count=count)
         for video in videos:
-            cursor.execute("SELECT original_filename, external_id FROM peertube_videos WHERE id = ?", (video["id"],))
-            result = cursor.fetchone()
-            if result is None or (result[0] is None and not result[1]):
-                video["original_filename"] = get_video_source(instance_url, video["id"], access_token)
-            else:
-                video["original_filename"] = result[0]
-        all_videos.extend(videos)
+            if video["createdAt"] <= since_created and video["updatedAt"] <= since_updated:
+                return changed_videos
+            changed_videos.append(video)
         start += count
+        if not videos or start >= total:
+            return changed_videos
 
-    imports = get_user_imports(instance_url, access_token)
+
+def load_existing_videos(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, manual_id, original_filename, external_id, source_url, updatedAt FROM peertube_videos")
+    return {
+        row[0]: {"manual_id": row[1], "original_filename": row[2], "external_id": row[3], "source_url": row[4], "updatedAt": row[5]}
+        for row in cursor.fetchall()
+    }
+
+
+def get_all_videos(instance_url, access_token, conn, max_workers=MAX_WORKERS, full=False, existing=None):
+    """
+    Without full, only the videos created or updated since the last sync are listed, using the
+    watermarks stored by save_videos.
+    """
+    count = 30
+    if existing is None:
+        existing = load_existing_videos(conn)
+
+    since_created = get_sync_state(conn, "videos_createdAt")
+    since_updated = get_sync_state(conn, "videos_updatedAt")
+    delta = not full and since_created is not None and since_updated is not None
+
+    known_imports = {video_id for video_id, row in existing.items() if row["source_url"] is not None} if delta else None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        imports_future = executor.submit(get_user_imports, instance_url, access_token, known_imports)
+
+        if delta:
+            all_videos = list_changed_videos(instance_url, access_token, since_created, since_updated, count=count)
+        else:
+            # the first page tells us how many there are, the rest are fetched in parallel
+            all_videos, total = get_peertube_videos(instance_url, access_token, start=0, count=count)
+            pages = executor.map(lambda start: get_peertube_videos(instance_url, access_token, start=start, count=count)[0], range(count, total, count))
+            for videos in pages:
+                all_videos.extend(videos)
+
+        missing_source = []
+        for video in all_videos:
+            result = existing.get(str(video["id"]))
+            if result is None or (result["original_filename"] is None and not result["external_id"]):
+                missing_source.append(video)
+            else:
+                video["original_filename"] = result["original_filename"]
+            # the imports we fetched may not reach back this far, keep what we know
+            if result is not None:
+                video["source_url"] = result["source_url"]
+
+        sources = executor.map(lambda video: get_video_source(instance_url, video["id"], access_token), missing_source)
+        for video, filename in zip(missing_source, tqdm(sources, total=len(missing_source))):
+            video["original_filename"] = filename
+
+        imports = imports_future.result()
+
+    videos_by_id = {str(video["id"]): video for video in all_videos}
     for import_data in imports:
-        matching_video = next((v for v in all_videos if v["id"] == import_data["video"]["id"]), None)
+        matching_video = videos_by_id.get(str(import_data["video"]["id"]))
         if matching_video:
             matching_video["source_url"] = import_data.get("targetUrl")
 
     return all_videos
 
 
+def get_sync_state(conn, key):
+    cursor = conn.cursor()
+    cursor.execute("SELECT value FROM sync_state WHERE key = ?", (key,))
+    result = cursor.fetchone()
+    return result[0] if result else None
+
+
+def set_sync_state(conn, key, value):
+    cursor = conn.cursor()
+    cursor.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+
+def video_changed(existing, video):
+    row = existing.get(str(video["id"]))
+    return row is None or (row["updatedAt"], row["original_filename"], row["source_url"]) != (
+        video["updatedAt"],
+        video.get("original_filename"),
+        video.get("source_url"),
+    )
+
+
+def save_videos(conn, videos, existing=None):
+    """
+    Upserts the videos that changed and moves the sync watermarks forward, all in one transaction.
+    Returns the number of rows written.
+    """
+    if existing is None:
+        existing = load_existing_videos(conn)
+    changed = [video for video in videos if video_changed(existing, video)]
+    with conn:
+        upsert_videos(conn, changed, existing)
+        if videos:
+            created = max(video["createdAt"] for video in videos)
+            updated = max(video["updatedAt"] for video in videos)
+            set_sync_state(conn, "videos_createdAt", max(created, get_sync_state(conn, "videos_createdAt") or ""))
+            set_sync_state(conn, "videos_updatedAt", max(updated, get_sync_state(conn, "videos_updatedAt") or ""))
+    return len(changed)
+
+
 def create_database():
     conn = sqlite3.connect("data.db")
     cursor = conn.cursor()
@@ -130,7 +251,23 @@ def create_database():
         source_url TEXT,
         manual_id TEXT,
         external_id TEXT,
-        original_publish_date TEXT
+        original_publish_date TEXT,
+        date_synced TEXT
+    )
+    """
+    )
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS peertube_videos_external_id ON peertube_videos (external_id)")
+
+    cursor.execute("pragma table_info(peertube_videos)")
+    if "date_synced" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE peertube_videos ADD COLUMN date_synced TEXT")
+
+    cursor.execute(
+        """
+    CREATE TABLE IF NOT EXISTS sync_state (
+        key TEXT PRIMARY KEY,
+        value TEXT
     )
     """
     )
@@ -143,78 +280,20 @@ def determine_external_id(video):
     if video.get("manual_id"):
         return video["manual_id"]
 
+    external_id = None
     if video.get("source_url"):
-        twitch_match = re.search(r"v(\d+)(?:\.mp4)?$", video["source_url"])
-        if twitch_match:
-            return f"twitch:v{twitch_match.group(1)}"
-        youtube_match = re.search(r"(?:youtu\.be/|youtube\.com/(?:embed/|v/|watch\?v=|watch\?.+&v=))([^&?/]+)", video["source_url"])
-        if youtube_match:
-            return f"youtube:{youtube_match.group(1)}"
-
-    if video.get("original_filename"):
-        twitch_match = re.search(r"v(\d+)\.mp4$", video["original_filename"])
-        if twitch_match:
-            return f"twitch:v{twitch_match.group(1)}"
-        youtube_match = re.search(r" ([A-Za-z0-9_-]{11})$", video["original_filename"].rsplit(".", 1)[0])
-        if youtube_match:
-            return f"youtube:{youtube_match.group(1)}"
-
-    return None
-
-
-def insert_or_update_video(conn, video):
-    cursor = conn.cursor()
-
-    # Check if the video already exists
-    cursor.execute("SELECT manual_id FROM peertube_videos WHERE id = ?", (video["id"],))
-    existing = cursor.fetchone()
-
-    if existing:
-        manual_id = existing[0]
-        external_id = determine_external_id({**video, "manual_id": manual_id})
-        cursor.execute(
-            """
-        UPDATE peertube_videos SET
-            name = ?, description = ?, duration = ?, views = ?, likes = ?,
-            dislikes = ?, nsfw = ?, thumbnailPath = ?, createdAt = ?,
-            publishedAt = ?, updatedAt = ?, channel = ?, channelId = ?,
-            privacy = ?, url = ?, original_filename = ?, source_url = ?,
-            external_id = ?, original_publish_date = ?
-        WHERE id = ?
-        """,
-            (
-                video["name"],
-                video["description"],
-                video["duration"],
-                video["views"],
-                video["likes"],
-                video["dislikes"],
-                video["nsfw"],
-                video["thumbnailPath"],
-                video["createdAt"],
-                video["publishedAt"],
-                video["updatedAt"],
-                video["channel"]["name"],
-                video["channel"]["id"],
-                video["privacy"]["id"],
-                video["url"],
-                video.get("original_filename"),
-                video.get("source_url"),
-                external_id,
-                video.get("originallyPublishedAt"),
-                video["id"],
-            ),
-        )
-    else:
-        external_id = determine_external_id(video)
-        cursor.execute(
-            """
-        INSERT INTO peertube_videos (
-            id, name, description, duration, views, likes, dislikes, nsfw,
-            thumbnailPath, createdAt, publishedAt, updatedAt, channel, channelId,
-            privacy, url, original_filename, source_url, external_id, original_publish_date
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        external_id = reconcile.external_id_from_url(video["source_url"])
+    if external_id is None and video.get("original_filename"):
+        external_id = reconcile.external_id_from_filename(video["original_filename"])
+    return external_id
+
+
+def upsert_videos(conn, videos, existing):
+    rows = []
+    for video in videos:
+        # manual_id is only ever set by hand in the database, it's never overwritten
+        manual_id = existing.get(str(video["id"]), {}).get("manual_id")
+        rows.append(
             (
                 video["id"],
                 video["name"],
@@ -234,18 +313,35 @@ def insert_or_update_video(conn, video):
                 video["url"],
                 video.get("original_filename"),
                 video.get("source_url"),
-                external_id,
+                determine_external_id({**video, "manual_id": manual_id}),
                 video.get("originallyPublishedAt"),
-            ),
+            )
         )
 
-    conn.commit()
+    conn.executemany(
+        """
+    INSERT INTO peertube_videos (
+        id, name, description, duration, views, likes, dislikes, nsfw,
+        thumbnailPath, createdAt, publishedAt, updatedAt, channel, channelId,
+        privacy, url, original_filename, source_url, external_id, original_publish_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        name = excluded.name, description = excluded.description, duration = excluded.duration,
+        views = excluded.views, likes = excluded.likes, dislikes = excluded.dislikes, nsfw = excluded.nsfw,
+        thumbnailPath = excluded.thumbnailPath, createdAt = excluded.createdAt,
+        publishedAt = excluded.publishedAt, updatedAt = excluded.updatedAt, channel = excluded.channel,
+        channelId = excluded.channelId, privacy = excluded.privacy, url = excluded.url,
+        original_filename = excluded.original_filename, source_url = excluded.source_url,
+        external_id = excluded.external_id, original_publish_date = excluded.original_publish_date
+    """,
+        rows,
+    )
 
 
 def get_video_info_from_peertube(instance_url, access_token, video_id):
     headers = {"Authorization": f"Bearer {access_token}"}
     api_url = f"{instance_url}/api/v1/videos/{video_id}"
-    response = requests.get(api_url, headers=headers)
+    response = session.get(api_url, headers=headers)
     if response.status_code == 200:
         return response.json()
     return None
@@ -255,77 +351,104 @@ def update_video_date_on_peertube(instance_url, access_token, video_id, new_date
     headers = {"Authorization": f"Bearer {access_token}"}
     api_url = f"{instance_url}/api/v1/videos/{video_id}"
     data = {"originallyPublishedAt": new_date}
-    response = requests.put(api_url, headers=headers, json=data)
+    response = session.put(api_url, headers=headers, json=data)
     return response.status_code == 204
 
 
-def update_dates_on_peertube(conn, instance_url, access_token):
+def sync_video_date(instance_url, access_token, video_id, local_date):
+    video_info = get_video_info_from_peertube(instance_url, access_token, video_id)
+    if video_info is None:
+        print(f"Failed to fetch info for video {video_id}")
+        return "failure"
+
+    if video_info.get("originallyPublishedAt") is not None:
+        return "skipped"
+
+    if update_video_date_on_peertube(instance_url, access_token, video_id, local_date):
+        return "success"
+    print(f"Failed to update date for video {video_id}")
+    return "failure"
+
+
+def update_dates_on_peertube(conn, instance_url, access_token, max_workers=MAX_WORKERS):
+    """
+    Videos whose date is confirmed on peertube get date_synced set, later runs don't ask about them again.
+    """
     cursor = conn.cursor()
 
     # get videos without original publish date
-    cursor.execute("SELECT id, original_filename FROM peertube_videos WHERE original_publish_date IS NULL")
-    videos = cursor.fetchall()
-    for video_id, filename in videos:
+    cursor.execute("SELECT id, original_filename FROM peertube_videos WHERE original_publish_date IS NULL AND date_synced IS NULL")
+    filename_dates = []
+    for video_id, filename in cursor.fetchall():
         if filename is None:
             continue
 
-
         date_match = re.search(r"^(\d{8}) - ", filename)
         if date_match:
             new_date = date_match.group(1)
-            new_date_formatted = f"{new_date[:4]}-{new_date[4:6]}-{new_date[6:8]}"
-            if not update_video_date_on_peertube(instance_url, access_token, video_id, new_date_formatted):
+            filename_dates.append((video_id, f"{new_date[:4]}-{new_date[4:6]}-{new_date[6:8]}"))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        updated = executor.map(lambda item: update_video_date_on_peertube(instance_url, access_token, *item), filename_dates)
+        confirmed = []
+        for (video_id, new_date), ok in zip(filename_dates, updated):
+            if ok:
+                confirmed.append((new_date, video_id))
+            else:
                 print(f"Failed to update date for video {video_id}")
+    with conn:
+        conn.executemany("UPDATE peertube_videos SET date_synced = ? WHERE id = ?", confirmed)
 
-    conn.commit()
-
-    cursor.execute("SELECT id, original_publish_date FROM peertube_videos WHERE original_publish_date IS NOT NULL")
+    cursor.execute("SELECT count(*) FROM peertube_videos WHERE original_publish_date IS NOT NULL AND date_synced IS NOT NULL")
+    skipped_count = cursor.fetchone()[0]
+    cursor.execute("SELECT id, original_publish_date FROM peertube_videos WHERE original_publish_date IS NOT NULL AND date_synced IS NULL")
     videos = cursor.fetchall()
 
     success_count = 0
     failure_count = 0
-    skipped_count = 0
-
-    for video_id, local_date in videos:
-        video_info = get_video_info_from_peertube(instance_url, access_token, video_id)
-        if video_info is None:
-            print(f"Failed to fetch info for video {video_id}")
-            failure_count += 1
-            continue
-
-        if video_info.get("originallyPublishedAt") is not None:
-            # print(f"Skipping video {video_id} as it already has an original publish date")
-            skipped_count += 1
-            continue
 
-        if update_video_date_on_peertube(instance_url, access_token, video_id, local_date):
-            # print(f"Successfully updated date for video {video_id} to {local_date}")
-            success_count += 1
-        else:
-            print(f"Failed to update date for video {video_id}")
-            failure_count += 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda video: sync_video_date(instance_url, access_token, *video), videos)
+        confirmed = []
+        for (video_id, local_date), result in zip(videos, results):
+            if result == "failure":
+                failure_count += 1
+                continue
+            if result == "success":
+                success_count += 1
+            else:
+                skipped_count += 1
+            confirmed.append((local_date, video_id))
+    with conn:
+        conn.executemany("UPDATE peertube_videos SET date_synced = ? WHERE id = ?", confirmed)
 
     print(f"\nUpdate complete. Successes: {success_count}, Failures: {failure_count}, Skipped: {skipped_count}")
 
 
 if __name__ == "__main__":
-    instance_url = "https://peertube.nodja.com"
     load_dotenv()
+    instance_url = os.getenv("PEERTUBE_URL", "https://peertube.nodja.com")
 
     username = os.getenv("PEERTUBE_USERNAME")
     password = os.getenv("PEERTUBE_PASSWORD")
 
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--full", action="store_true", help="list every video instead of only the ones changed since the last sync")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    args = parser.parse_args()
+    session = create_session(args.workers)
+
     client_id, client_secret = get_client_credentials(instance_url)
     access_token = get_user_token(instance_url, client_id, client_secret, username, password)
 
     conn = create_database()
 
-    update_dates_on_peertube(conn, instance_url, access_token)
+    update_dates_on_peertube(conn, instance_url, access_token, max_workers=args.workers)
 
-    all_videos = get_all_videos(instance_url, access_token, conn)
-    for video in all_videos:
-        insert_or_update_video(conn, video)
+    existing = load_existing_videos(conn)
+    all_videos = get_all_videos(instance_url, access_token, conn, max_workers=args.workers, full=args.full, existing=existing)
+    saved = save_videos(conn, all_videos, existing)
 
-    print(f"Total videos processed: {len(all_videos)}")
+    print(f"Total videos processed: {len(all_videos)}, changed: {saved}")
 
     conn.close()
@@ -1,19 +1,21 @@
-import csv
-import datetime
-import glob
+import argparse
+import gzip
+import fnmatch
+import hashlib
 import json
 import os
 import re
 import shutil
 import sqlite3
-import urllib.parse
 from collections import defaultdict
+from multiprocessing import Pool
 from pathlib import Path
 
-import internetarchive as ia
-import pysrt
 from tqdm.auto import tqdm
 
+import reconcile
+from inverted_index import write_inverted_index, write_positional_index
+
 
 def create_db():
     connection = sqlite3.connect("./data.db")
@@ -27,7 +29,9 @@ def create_db():
             vod_id TEXT PRIMARY KEY,
             video_url_peertube TEXT,
             title TEXT,
-            date TEXT
+            date TEXT,
+            external_id TEXT,
+            game TEXT
         )
     """
     )
@@ -38,164 +42,861 @@ def create_db():
                 vod TEXT,
                 sub_index INTEGER,
                 speaker INTEGER,
-                start_time TEXT,
-                end_time TEXT,
+                start_ms INTEGER,
+                end_ms INTEGER,
                 content TEXT
             )
         """
     )
+    cursor.execute(
+        """
+            CREATE TABLE IF NOT EXISTS vod_speakers (
+                vod TEXT,
+                speaker INTEGER,
+                lines INTEGER,
+                duration_ms INTEGER,
+                PRIMARY KEY (vod, speaker)
+            ) WITHOUT ROWID
+        """
+    )
+    cursor.execute(
+        """
+            CREATE TABLE IF NOT EXISTS vod_games (
+                vod TEXT,
+                game TEXT,
+                PRIMARY KEY (vod, game)
+            ) WITHOUT ROWID
+        """
+    )
+    migrate_db(connection, cursor)
+    cursor.execute("CREATE INDEX IF NOT EXISTS transcripts_vod_start ON transcripts (vod, start_ms, end_ms)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS vods_external_id ON vods (external_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS vods_date ON vods (date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS vod_games_game ON vod_games (game, vod)")
     return connection, cursor
 
 
-def import_srt_to_sqlite(connection, cursor, srt_file, vod_id):
-    subtitles = pysrt.open(srt_file)
+def table_columns(cursor, table):
+    cursor.execute(f"pragma table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def migrate_db(connection, cursor):
+    # databases from before transcript times were stored as integer milliseconds
+    if "start_time" in table_columns(cursor, "transcripts"):
+        connection.create_function("srt_time_to_ms", 1, parse_srt_time, deterministic=True)
+        cursor.execute("ALTER TABLE transcripts ADD COLUMN start_ms INTEGER")
+        cursor.execute("ALTER TABLE transcripts ADD COLUMN end_ms INTEGER")
+        cursor.execute("UPDATE transcripts SET start_ms = srt_time_to_ms(start_time), end_ms = srt_time_to_ms(end_time)")
+        cursor.execute("ALTER TABLE transcripts DROP COLUMN start_time")
+        cursor.execute("ALTER TABLE transcripts DROP COLUMN end_time")
+        connection.commit()
+
+    if "external_id" not in table_columns(cursor, "vods"):
+        connection.create_function("vod_external_id", 1, reconcile.external_id_from_vod_id, deterministic=True)
+        cursor.execute("ALTER TABLE vods ADD COLUMN external_id TEXT")
+        cursor.execute("UPDATE vods SET external_id = vod_external_id(vod_id)")
+        connection.commit()
+
+    if "game" not in table_columns(cursor, "vods"):
+        cursor.execute("ALTER TABLE vods ADD COLUMN game TEXT")
+        connection.commit()
+
+    # the speaker filter is checked on the lines the text match finds, nothing reads this index
+    cursor.execute("DROP INDEX IF EXISTS transcripts_speaker_vod")
+    # games are filtered through vod_games now
+    cursor.execute("DROP INDEX IF EXISTS vods_game")
+
+
+TRANSCRIPT_INSERT = """
+    INSERT INTO transcripts (vod, sub_index, speaker, start_ms, end_ms, content)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
-    pattern = r"\[\w+_(\d+)\]: (.+)"
-    records = []
+SRT_TIMING = re.compile(r"(\d+):(\d+):(\d+)[,.](\d+)\s*-->\s*(\d+):(\d+):(\d+)[,.](\d+)")
+SRT_SPEAKER = re.compile(r"\[\w+_(\d+)\]: (.+)")
 
-    for index, subtitle in enumerate(subtitles):
-        match = re.match(pattern, subtitle.text)
+
+def srt_time_to_ms(hours, minutes, seconds, milliseconds):
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(milliseconds)
+
+
+def parse_srt_time(value):
+    match = re.match(r"(\d+):(\d+):(\d+)[,.](\d+)", value)
+    return srt_time_to_ms(*match.groups()) if match else None
+
+
+def read_srt(srt_file, vod_id):
+    """
+    Streams (vod, sub_index, speaker, start_ms, end_ms, content) records out of an srt file
+    one cue at a time, so memory use doesn't depend on the length of the transcript.
+    """
+
+    def make_record(index, timing, lines):
+        text = "\n".join(lines)
+        match = SRT_SPEAKER.match(text)
         if match:
             speaker_id = match.group(1)
             content = match.group(2)
         else:
             speaker_id = 99
-            content = subtitle.text
-
-        record = (
-            vod_id,
-            index + 1,
-            speaker_id,
-            str(subtitle.start),
-            str(subtitle.end),
+            content = text
+        return (vod_id, index, speaker_id, srt_time_to_ms(*timing[:4]), srt_time_to_ms(*timing[4:]), content)
+
+    index = 0
+    timing = None
+    lines = []
+    with open(srt_file, encoding="utf-8-sig", buffering=1024 * 1024) as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if timing is None:
+                # skips the cue number and anything else before the timing line
+                match = SRT_TIMING.search(line)
+                if match:
+                    timing = match.groups()
+                    lines = []
+                continue
+            if line.strip():
+                lines.append(line)
+                continue
+            index += 1
+            yield make_record(index, timing, lines)
+            timing = None
+
+    if timing is not None:
+        index += 1
+        yield make_record(index, timing, lines)
+
+
+def parse_srt(srt_file, vod_id):
+    return list(read_srt(srt_file, vod_id))
+
+
+def import_srt_to_sqlite(connection, cursor, srt_file, vod_id):
+    cursor.executemany(TRANSCRIPT_INSERT, read_srt(srt_file, vod_id))
+    connection.commit()
+
+
+def parse_srt_filename(file):
+    splits = file.stem.split(" - ")
+    vod_id = splits[-1]
+    title = " - ".join(splits[1:-1])
+
+    date = splits[0]
+    date = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
+    return vod_id, title, date
+
+
+def parse_srt_job(file):
+    vod_id, title, date = parse_srt_filename(file)
+    return vod_id, title, date, parse_srt(file, vod_id)
+
+
+def import_transcripts(connection, cursor, files, workers=1, batch_size=100):
+    """
+    Parses srt files in a process pool and writes them from this process only,
+    committing every batch_size files instead of after each one.
+    """
+    cursor.execute("SELECT vod_id FROM vods")
+    existing = {row["vod_id"] for row in cursor.fetchall()}
+
+    todo = []
+    for file in files:
+        vod_id = parse_srt_filename(file)[0]
+        if vod_id not in existing:
+            existing.add(vod_id)
+            todo.append(file)
+    if not todo:
+        return 0
+
+    pool = Pool(workers) if workers > 1 else None
+    jobs = pool.imap_unordered(parse_srt_job, todo, chunksize=4) if pool else map(parse_srt_job, todo)
+    try:
+        for imported, (vod_id, title, date, records) in enumerate(tqdm(jobs, total=len(todo), unit="file"), 1):
+            cursor.executemany(TRANSCRIPT_INSERT, records)
+            cursor.execute("INSERT INTO vods (vod_id, title, date, external_id) VALUES (?,?,?,?)", (vod_id, title, date, reconcile.external_id_from_vod_id(vod_id)))
+            if imported % batch_size == 0:
+                connection.commit()
+        connection.commit()
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return len(todo)
+
+
+def update_vod_speakers(connection):
+    # summaries for the vods that don't have one yet
+    with connection:
+        connection.execute(
+            """
+            INSERT INTO vod_speakers (vod, speaker, lines, duration_ms)
+            SELECT vod, speaker, count(*), sum(end_ms - start_ms)
+            FROM transcripts
+            WHERE vod NOT IN (SELECT vod FROM vod_speakers)
+            GROUP BY vod, speaker
+        """
+        )
+
+
+def build_fts_index(connection):
+    cursor = connection.cursor()
+    # external content table, the text itself stays in transcripts and is looked up by rowid
+    cursor.execute("DROP TABLE IF EXISTS transcripts_fts")
+    cursor.execute(
+        """
+        CREATE VIRTUAL TABLE transcripts_fts USING fts5(
             content,
+            content='transcripts',
+            content_rowid='rowid',
+            tokenize='trigram'
+        )
+    """
+    )
+    cursor.execute("INSERT INTO transcripts_fts(transcripts_fts) VALUES ('rebuild')")
+    # merge the index into as few b-trees as possible so a lookup touches fewer pages
+    cursor.execute("INSERT INTO transcripts_fts(transcripts_fts) VALUES ('optimize')")
+    connection.commit()
+
+
+SEARCH_QUERY = """
+    select vod_id, vods.title, vods.video_url_peertube, vods.date, speaker, start_ms, end_ms, content
+    from transcripts
+    left join vods on transcripts.vod = vods.vod_id
+    where {where}
+    order by vods.date desc, vods.vod_id desc, start_ms, end_ms
+"""
+
+
+MAIN_SPEAKERS = """
+    select vod, speaker from (
+        select vod, speaker, row_number() over (partition by vod order by duration_ms desc, speaker) as rank
+        from vod_speakers
+    ) where rank = 1
+"""
+
+
+def speaker_filter(speaker):
+    """
+    Where clause and parameters limiting lines to a speaker id, or with "main" to the speaker
+    with the most talking time in each vod. There is no speaker index: the text match finds the
+    lines and the speaker is checked on those. The unary + keeps the planner from driving "main"
+    through transcripts_vod_start instead, which would read every line of every vod. "main" is
+    resolved to (vod, speaker) pairs by one uncorrelated subquery, evaluated once.
+    """
+    if speaker is None:
+        return [], []
+    if speaker == "main":
+        return [f"(+transcripts.vod, +transcripts.speaker) in ({MAIN_SPEAKERS})"], []
+    return ["+transcripts.speaker = ?"], [int(speaker)]
+
+
+def vod_filter(year=None, game=None):
+    """
+    Where clause and parameters limiting lines to the vods of a year and/or game, looked up
+    through the vods_date and vod_games_game indexes before any transcript is read. A vod with
+    several games matches each of them.
+    """
+    conditions = []
+    params = []
+    if year is not None:
+        conditions.append("transcripts.vod in (select vod_id from vods where date >= ? and date < ?)")
+        params += [f"{int(year):04}-01-01", f"{int(year) + 1:04}-01-01"]
+    if game is not None:
+        conditions.append("transcripts.vod in (select vod from vod_games where game = ?)")
+        params.append(game)
+    return conditions, params
+
+
+def search_transcripts(cursor, term, use_fts=True, speaker=None, year=None, game=None):
+    """
+    Same rows as the frontend search. With use_fts=False it runs the old full scan
+    `content like '%term%'` so both paths can be compared against each other.
+    The text match drives the query, speaker, year and game are checked on the lines it finds.
+    """
+    where, params = speaker_filter(speaker)
+    vod_where, vod_params = vod_filter(year, game)
+    where += vod_where
+    params += vod_params
+    if use_fts:
+        where.append("transcripts.rowid in (select rowid from transcripts_fts where transcripts_fts.content like ?)")
+    else:
+        where.append("content like ?")
+    cursor.execute(SEARCH_QUERY.format(where=" and ".join(where)), params + [f"%{term}%"])
+    return cursor.fetchall()
+
+
+# like in sqlite only folds the case of ascii letters
+ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+WORD_RUN = re.compile(r"\w+")
+TERM_VODS_TERM = re.compile(r"[A-Za-z0-9]+")
+
+
+def contained_terms(word, terms, cache):
+    # every term that occurs somewhere inside word, memoized per distinct word
+    found = cache.get(word)
+    if found is None:
+        found = {word[i:j] for i in range(len(word)) for j in range(i + 1, len(word) + 1)} & terms
+        cache[word] = found
+    return found
+
+
+def line_terms(content, terms, cache):
+    """
+    The terms among `terms` that content matches with like '%term%'. A term made of word
+    characters can only occur inside a single run of word characters, so the runs of the line are
+    enough to find them.
+    """
+    found = set()
+    for word in set(WORD_RUN.findall(content.translate(ASCII_LOWER))):
+        found |= contained_terms(word, terms, cache)
+    return found
+
+
+def build_term_vods(connection, min_hits=500):
+    """
+    Postings of term -> vod with the number of matching lines and the first one, for the words that
+    occur in at least min_hits lines. Those are the searches that would otherwise pull tens of
+    thousands of rows just to draw the vod list, rarer terms are cheap enough through transcripts_fts.
+
+    A line counts for a term when `content like '%term%'` matches it, the same rule as the fts
+    search and the line load in the frontend, so the vod list and hits are the same whichever
+    path answers a search (a line with only "there" counts for "the").
+    """
+    cursor = connection.cursor()
+    cursor.execute("DROP TABLE IF EXISTS term_vods")
+    cursor.execute(
+        """
+        CREATE TABLE term_vods (
+            term TEXT,
+            vod TEXT,
+            hits INTEGER,
+            first_sub_index INTEGER,
+            PRIMARY KEY (term, vod)
+        ) WITHOUT ROWID
+    """
+    )
+
+    # first pass picks the common words, second builds their postings one vod at a time
+    line_counts = defaultdict(int)
+    for (content,) in cursor.execute("SELECT content FROM transcripts"):
+        for word in set(WORD_RUN.findall(content.translate(ASCII_LOWER))):
+            line_counts[word] += 1
+    common_terms = {term for term, count in line_counts.items() if count >= min_hits and TERM_VODS_TERM.fullmatch(term)}
+    del line_counts
+
+    def flush(vod, postings):
+        connection.executemany(
+            "INSERT INTO term_vods (term, vod, hits, first_sub_index) VALUES (?, ?, ?, ?)",
+            ((term, vod, hits, first) for term, (hits, first) in postings.items()),
         )
-        records.append(record)
 
-    cursor.executemany(
+    cache = {}
+    current_vod = None
+    postings = {}
+    for vod, sub_index, content in cursor.execute("SELECT vod, sub_index, content FROM transcripts ORDER BY vod, sub_index"):
+        if vod != current_vod:
+            if postings:
+                flush(current_vod, postings)
+            current_vod = vod
+            postings = {}
+        for term in line_terms(content, common_terms, cache):
+            hits, first = postings.get(term, (0, sub_index))
+            postings[term] = (hits + 1, first)
+    if postings:
+        flush(current_vod, postings)
+    connection.commit()
+
+
+VOD_LIST_QUERY = """
+    select vod_id, vods.title, vods.video_url_peertube, vods.date, hits, first_sub_index
+    from term_vods
+    join vods on term_vods.vod = vods.vod_id
+    where term = ?
+    order by vods.date desc, vods.vod_id desc
+"""
+
+
+def search_vods(cursor, term):
+    """
+    The vod list for a search. Common words (letters and digits only, so like has no wildcard in
+    them) come straight from term_vods, anything else is grouped from the matching transcript
+    lines. Both match `content like '%term%'`.
+    """
+    if TERM_VODS_TERM.fullmatch(term):
+        cursor.execute(VOD_LIST_QUERY, (term.translate(ASCII_LOWER),))
+        rows = cursor.fetchall()
+        if rows:
+            return rows
+
+    cursor.execute(
         """
-        INSERT INTO transcripts (vod, sub_index, speaker, start_time, end_time, content)
-        VALUES (?, ?, ?, ?, ?, ?)
+        select vod_id, vods.title, vods.video_url_peertube, vods.date, count(*) as hits, min(sub_index) as first_sub_index
+        from transcripts
+        left join vods on transcripts.vod = vods.vod_id
+        where transcripts.rowid in (select rowid from transcripts_fts where transcripts_fts.content like ?)
+        group by transcripts.vod
+        order by vods.date desc, vods.vod_id desc
     """,
-        records,
+        (f"%{term}%",),
+    )
+    return cursor.fetchall()
+
+
+def search_vod_lines(cursor, vod_id, term):
+    cursor.execute(
+        SEARCH_QUERY.format(where="transcripts.vod = ? and transcripts.rowid in (select rowid from transcripts_fts where transcripts_fts.content like ?)"),
+        (vod_id, f"%{term}%"),
+    )
+    return cursor.fetchall()
+
+
+# sql.js-httpvfs reads whole pages, small pages mean less wasted bytes per range request
+PUBLISH_PAGE_SIZE = 1024
+
+
+def table_sizes(connection):
+    # bytes per table, with its indexes and (for virtual tables like fts) its shadow tables
+    owners = dict(connection.execute("SELECT name, tbl_name FROM sqlite_master WHERE type IN ('table', 'index')").fetchall())
+    virtual = [name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE sql LIKE 'CREATE VIRTUAL TABLE%'")]
+    sizes = defaultdict(int)
+    try:
+        rows = connection.execute("SELECT name, sum(pgsize) FROM dbstat GROUP BY name").fetchall()
+    except sqlite3.OperationalError:
+        # sqlite built without dbstat
+        return {}
+    for name, size in rows:
+        owner = owners.get(name, name)
+        owner = next((table for table in virtual if owner.startswith(f"{table}_")), owner)
+        sizes[owner] += size
+    return dict(sorted(sizes.items(), key=lambda item: -item[1]))
+
+
+def db_stats(file):
+    connection = sqlite3.connect(file)
+    page_size = connection.execute("pragma page_size").fetchone()[0]
+    page_count = connection.execute("pragma page_count").fetchone()[0]
+    freelist_count = connection.execute("pragma freelist_count").fetchone()[0]
+    tables = table_sizes(connection)
+    connection.close()
+    return {
+        "size": os.path.getsize(file),
+        "page_size": page_size,
+        "page_count": page_count,
+        "freelist_count": freelist_count,
+        "tables": tables,
+    }
+
+
+def optimize_db(source="data.db", target="publish.db"):
+    """
+    Builds a publish-only copy of the database with just what the frontend reads,
+    transcripts stored in the order the UI asks for them, then vacuums it.
+
+    The copy is bigger than data.db: the trigram fts index is roughly the size of the
+    transcripts again, and term_vods adds more. That is on purpose, the client never downloads
+    the whole file, only the pages a query touches, and without the trigram index every
+    substring search reads all of transcripts. The per-table sizes are printed so the trade-off
+    stays visible, search_benchmark.py measures the bytes per query.
+    """
+    if os.path.exists(target):
+        os.remove(target)
+
+    connection = sqlite3.connect(target)
+    cursor = connection.cursor()
+    # page size has to be set before the first table is created
+    cursor.execute(f"pragma page_size = {PUBLISH_PAGE_SIZE}")
+    cursor.execute("pragma journal_mode = delete")
+    cursor.execute("ATTACH DATABASE ? AS source", (source,))
+
+    # VACUUM copies the tables in the order they were created, each followed by its indexes, so
+    # transcripts comes first: its pages start right after the root pages and nothing that grows
+    # with every vod (vods, vod_speakers, the indexes, fts, term_vods) sits in front of them.
+    # The lines of a vod sit on neighbouring pages and new vods are appended at the end of the
+    # table, so the transcript pages of an earlier export stay byte-identical and keep their
+    # content-addressed chunk. That only holds when new vods are newer than everything already
+    # published. Page 0, the last transcript pages and everything stored after the transcripts
+    # change on every export, so clients download the chunks holding those again each time
+    cursor.execute(
+        """
+        CREATE TABLE transcripts (
+            vod TEXT,
+            sub_index INTEGER,
+            speaker INTEGER,
+            start_ms INTEGER,
+            end_ms INTEGER,
+            content TEXT
+        )
+    """
+    )
+    cursor.execute(
+        """
+        INSERT INTO transcripts (vod, sub_index, speaker, start_ms, end_ms, content)
+        SELECT t.vod, t.sub_index, t.speaker, t.start_ms, t.end_ms, t.content
+        FROM source.transcripts t
+        LEFT JOIN source.vods v ON t.vod = v.vod_id
+        ORDER BY v.date, t.vod, t.sub_index
+    """
     )
+    connection.commit()
 
+    cursor.execute(
+        """
+        CREATE TABLE vods (
+            vod_id TEXT PRIMARY KEY,
+            video_url_peertube TEXT,
+            title TEXT,
+            date TEXT,
+            game TEXT
+        )
+    """
+    )
+    cursor.execute(
+        """
+        INSERT INTO vods (vod_id, video_url_peertube, title, date, game)
+        SELECT vod_id, video_url_peertube, title, date, game FROM source.vods
+        ORDER BY date, vod_id
+    """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE vod_speakers (
+            vod TEXT,
+            speaker INTEGER,
+            lines INTEGER,
+            duration_ms INTEGER,
+            PRIMARY KEY (vod, speaker)
+        ) WITHOUT ROWID
+    """
+    )
+    cursor.execute("INSERT INTO vod_speakers SELECT vod, speaker, lines, duration_ms FROM source.vod_speakers")
+    cursor.execute(
+        """
+        CREATE TABLE vod_games (
+            vod TEXT,
+            game TEXT,
+            PRIMARY KEY (vod, game)
+        ) WITHOUT ROWID
+    """
+    )
+    cursor.execute("INSERT INTO vod_games SELECT vod, game FROM source.vod_games")
     connection.commit()
+    cursor.execute("DETACH DATABASE source")
+    cursor.execute("CREATE INDEX transcripts_vod_start ON transcripts (vod, start_ms, end_ms)")
+    cursor.execute("CREATE INDEX vods_date ON vods (date)")
+    cursor.execute("CREATE INDEX vod_games_game ON vod_games (game, vod)")
+
+    build_fts_index(connection)
+    build_term_vods(connection)
+    build_vod_facets(connection)
+    cursor.execute("VACUUM")
+    connection.close()
 
+    before = db_stats(source)
+    after = db_stats(target)
+    for name, stats in ((source, before), (target, after)):
+        print(f"{name}: {stats['size'] / 1024 / 1024:.1f} MB, {stats['page_count']} pages of {stats['page_size']} bytes, {stats['freelist_count']} free")
+    for table in dict.fromkeys([*after["tables"], *before["tables"]]):
+        print(f"    {table}: {before['tables'].get(table, 0) / 1024 / 1024:.1f} MB -> {after['tables'].get(table, 0) / 1024 / 1024:.1f} MB")
+    return before, after
 
-def split_db(file, dir):
-    size = os.path.getsize(file)
-    server_chunk_size = 10 * 1024 * 1024
-    suffix_length = 3
 
-    map(os.remove, glob.glob(f"{dir}/db.sqlite3*"))
-    split_command = f'split "{file}" --bytes={server_chunk_size} "{dir}/db.sqlite3." --suffix-length={suffix_length} --numeric-suffixes'
-    os.system(split_command)
+SERVER_CHUNK_SIZE = 10 * 1024 * 1024
+
 
-    request_chunk_size = os.popen(f'sqlite3 "{file}" "pragma page_size"').read()
+def write_atomic(path, data):
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def page_size(file):
+    connection = sqlite3.connect(file)
+    size = connection.execute("pragma page_size").fetchone()[0]
+    connection.close()
+    return size
+
+
+def write_chunks(file, dir, chunk_name, server_chunk_size=SERVER_CHUNK_SIZE, skip_existing=False):
+    """
+    Copies the database into server_chunk_size pieces in one pass, hashing each piece as it is
+    read. chunk_name(index, sha256) gives the file name. Every chunk goes through a temporary
+    file, so a reader never sees half a chunk. Returns (name, sha256, written) for each chunk.
+    """
+    os.makedirs(dir, exist_ok=True)
+    buffer = bytearray(server_chunk_size)
+    view = memoryview(buffer)
+    chunks = []
+    with open(file, "rb", buffering=0) as f:
+        while length := f.readinto(buffer):
+            data = view[:length]
+            digest = hashlib.sha256(data).hexdigest()
+            name = chunk_name(len(chunks), digest)
+            path = Path(dir) / name
+            written = not (skip_existing and path.exists())
+            if written:
+                write_atomic(path, data)
+            chunks.append((name, digest, written))
+    return chunks
+
+
+# what the chunk writers put in a directory, anything else there is left alone
+EXPORT_FILE_PATTERNS = ("db.sqlite3.*", "config*.json", "*.tmp")
+VOD_FILE_PATTERNS = ("transcripts.*.bin", "index.*.json", "*.tmp")
+
+
+def remove_stale(dir, keep, patterns=EXPORT_FILE_PATTERNS):
+    for item in Path(dir).iterdir():
+        if item.is_file() and item.name not in keep and any(fnmatch.fnmatch(item.name, pattern) for pattern in patterns):
+            item.unlink()
+
+
+def split_db(file, dir, checksums=True):
+    """
+    Numbered chunks (db.sqlite3.000, ...) and a plain config.json, the layout the unpatched
+    sql.js-httpvfs worker reads. export_db uses export_chunks instead, this stays for serving the
+    database with a stock worker.
+    """
+    suffix_length = 3
+    chunks = write_chunks(file, dir, lambda index, digest: f"db.sqlite3.{index:0{suffix_length}d}")
 
     config = {
         "serverMode": "chunked",
-        "requestChunkSize": request_chunk_size.strip(),
-        "databaseLengthBytes": size,
-        "serverChunkSize": server_chunk_size,
+        "requestChunkSize": page_size(file),
+        "databaseLengthBytes": os.path.getsize(file),
+        "serverChunkSize": SERVER_CHUNK_SIZE,
         "urlPrefix": "db.sqlite3.",
         "suffixLength": suffix_length,
     }
+    if checksums:
+        config["chunkSha256"] = [digest for name, digest, written in chunks]
+    write_atomic(Path(dir) / "config.json", json.dumps(config).encode())
+
+    remove_stale(dir, {name for name, digest, written in chunks} | {"config.json"})
+
+
+def export_chunks(file, dir):
+    """
+    Splits the database into chunks named by the hash of their content. Chunks that already
+    exist from a previous export are left untouched, so unchanged parts of the database keep
+    their url (and the browser cache for it).
+    """
+    chunks = write_chunks(file, dir, lambda index, digest: f"db.sqlite3.{digest[:16]}", skip_existing=True)
+    chunk_names = [name.removeprefix("db.sqlite3.") for name, digest, written in chunks]
+
+    config = {
+        "serverMode": "chunked",
+        "requestChunkSize": page_size(file),
+        "databaseLengthBytes": os.path.getsize(file),
+        "serverChunkSize": SERVER_CHUNK_SIZE,
+        "urlPrefix": "db.sqlite3.",
+        "suffixLength": 0,
+        "chunkNames": chunk_names,
+    }
+    config_data = json.dumps(config).encode()
+    config_name = f"config.{hashlib.sha256(config_data).hexdigest()[:16]}.json"
+    write_atomic(Path(dir) / config_name, config_data)
+
+    # anything the new manifest doesn't reference is from an older export
+    remove_stale(dir, {name for name, digest, written in chunks} | {config_name})
 
-    with open(f"{dir}/config.json", "w") as f:
-        json.dump(config, f)
+    print(f"Wrote {sum(written for name, digest, written in chunks)} of {len(chunks)} chunks")
+    return config_name
 
 
-def cleanup():
+def cleanup(keep=()):
     dir_path = Path("./static")
     prefix = "data"
 
     for item in dir_path.iterdir():
-        if item.name.startswith(prefix):
+        if item.name.startswith(prefix) and item.name not in keep:
             if item.is_file():
                 item.unlink()
             elif item.is_dir():
                 shutil.rmtree(item)
 
 
-def export_db():
-    cleanup()
-    now = datetime.datetime.now()
-    dir_name = f"data-{now.year}{now.month:02}{now.day:02}"
-    os.makedirs(f"./static/{dir_name}", exist_ok=True)
-    split_db("data.db", f"static/{dir_name}/")
+def export_vod_transcripts(file, dir):
+    """
+    Writes every vod's full transcript as its own gzip member, so the frontend can fetch one vod
+    with a single range request. Vods are grouped into a file per year and files are named by
+    the hash of their content, so only the current year's file changes when a vod is added.
+    The index maps vod_id to [file name, byte offset, byte length].
+    """
+    os.makedirs(dir, exist_ok=True)
+    connection = sqlite3.connect(file)
+    cursor = connection.cursor()
+    cursor.execute("SELECT vod_id, substr(coalesce(date, ''), 1, 4) FROM vods ORDER BY date, vod_id")
+    years = defaultdict(list)
+    for vod_id, year in cursor.fetchall():
+        years[year or "unknown"].append(vod_id)
+
+    index = {}
+    for year, vod_ids in sorted(years.items()):
+        blob = bytearray()
+        offsets = {}
+        for vod_id in vod_ids:
+            cursor.execute("SELECT speaker, start_ms, end_ms, content FROM transcripts WHERE vod = ? ORDER BY sub_index", (vod_id,))
+            rows = cursor.fetchall()
+            # columns compress better than a list of objects
+            lines = {
+                "speaker": [row[0] for row in rows],
+                "start_ms": [row[1] for row in rows],
+                "end_ms": [row[2] for row in rows],
+                "content": [row[3] for row in rows],
+            }
+            member = gzip.compress(json.dumps(lines, separators=(",", ":")).encode(), mtime=0)
+            offsets[vod_id] = (len(blob), len(member))
+            blob += member
+
+        name = f"transcripts.{hashlib.sha256(blob).hexdigest()[:16]}.bin"
+        path = Path(dir) / name
+        if not path.exists():
+            write_atomic(path, blob)
+        for vod_id, (offset, length) in offsets.items():
+            index[vod_id] = [name, offset, length]
+    connection.close()
+
+    index_data = json.dumps(index, separators=(",", ":"), sort_keys=True).encode()
+    index_name = f"index.{hashlib.sha256(index_data).hexdigest()[:16]}.json"
+    write_atomic(Path(dir) / index_name, index_data)
+
+    remove_stale(dir, {entry[0] for entry in index.values()} | {index_name}, VOD_FILE_PATTERNS)
+    return index_name
+
+
+def read_vod_transcript(dir, index_name, vod_id):
+    with open(Path(dir) / index_name) as f:
+        name, offset, length = json.load(f)[vod_id]
+    with open(Path(dir) / name, "rb") as f:
+        f.seek(offset)
+        return json.loads(gzip.decompress(f.read(length)))
+
+
+def export_db(vod_files=False, inverted_index=False, positional_index=False):
+    optimize_db("data.db", "publish.db")
+
+    dir_name = "data"
+    # only old data-YYYYMMDD exports, the chunk store is kept between runs
+    cleanup(keep=(dir_name, "data.json"))
+    config_name = export_chunks("publish.db", f"static/{dir_name}")
+    data = {"dir_name": f"./{dir_name}", "config_name": config_name}
+    if vod_files:
+        data["transcripts_dir"] = "./transcripts"
+        data["transcripts_index"] = export_vod_transcripts("publish.db", "static/transcripts")
+    if inverted_index:
+        data["index_dir"] = "./index"
+        data["index_manifest"] = write_inverted_index("publish.db", "static/index")
+    if positional_index:
+        data["positions_dir"] = "./positions"
+        data["positions_manifest"] = write_positional_index("publish.db", "static/positions")
     with open("static/data.json", "w") as f:
-        data = {"dir_name": f"./{dir_name}"}
         json.dump(data, f)
 
+    # an optional export that was left out this time would otherwise still be published, with
+    # nothing in data.json pointing at it
+    for enabled, dir in ((vod_files, "static/transcripts"), (inverted_index, "static/index"), (positional_index, "static/positions")):
+        if not enabled and os.path.isdir(dir):
+            shutil.rmtree(dir)
 
-def fill_vod_metadata(connection, cursor):
-
-    cursor.execute("SELECT external_id, name as title, url as video_url_peertube, original_publish_date as date FROM peertube_videos")
-    videos_peertube = {row["external_id"]: row for row in cursor.fetchall()}
-
-    cursor.execute("SELECT * FROM vods where video_url_peertube is null")
-
-    twitch_pattern = r"^v\d+$"
-    rows = [row for row in cursor.fetchall()]
-    for row in tqdm(rows):
-        vod_id = row["vod_id"]
-        date = row["date"]
-        title = None  # file title might be wrong so we force update it if we find a new one
-        video_url_peertube = row["video_url_peertube"]
-
-        is_twitch = re.match(twitch_pattern, vod_id)
-
-        external_id = "twitch:" + vod_id if is_twitch else "youtube:" + vod_id
-        if external_id not in videos_peertube:
-            print(f"Video {external_id} not found in peertube database")
-            continue
-
-        if not video_url_peertube:
-            video_url_peertube = videos_peertube[external_id]["video_url_peertube"]
-        if not title:
-            title = videos_peertube[external_id]["title"]
-        if not date:
-            date = videos_peertube[external_id]["date"]
-            date = date[:10] if date else None
 
+def fill_vod_metadata(connection, cursor):
+    # file title might be wrong so we force update it, the date is only filled in if we don't have one
+    with connection:
         cursor.execute(
-            "update vods set video_url_peertube = ?,  title = ?, date = ? where vod_id = ?",
-            (video_url_peertube, title, date, vod_id),
+            """
+            UPDATE vods SET
+                video_url_peertube = p.url,
+                title = p.name,
+                date = coalesce(vods.date, substr(p.original_publish_date, 1, 10))
+            FROM vod_mapping m JOIN peertube_videos p ON p.id = m.peertube_id
+            WHERE vods.video_url_peertube IS NULL AND m.vod_id = vods.vod_id
+        """
         )
-        connection.commit()
+        print(f"Filled metadata for {cursor.rowcount} vods")
 
+    cursor.execute("SELECT external_id FROM vods WHERE video_url_peertube IS NULL ORDER BY external_id")
+    missing = [row["external_id"] for row in cursor.fetchall()]
+    if missing:
+        print(f"{len(missing)} vods not found in peertube database: {', '.join(missing)}")
 
-if __name__ == "__main__":
-    connection, cursor = create_db()
-    transcripts_folder = Path(R"D:\Downloads\joe\transcripts")
-    data_to_import = []
 
-    done_work = False
-    for file in tqdm(list(transcripts_folder.glob("*.srt"))):
-        splits = file.stem.split(" - ")
-        vod_id = splits[-1]
-        title = " - ".join(splits[1:-1])
+def load_vod_games(connection, cursor):
+    """
+    Fills vod_games from the stream row reconcile matched the vod to (vod_mapping.stream_line).
+    A stream gets the games of its row and of the continuation rows below it, one row per game
+    so filters and facets see each of them. vods.game keeps them joined for display.
+    """
+    games_by_stream = defaultdict(list)
+    stream_of_line = {}
+    stream = None
+    cursor.execute("SELECT line, number, game FROM streams ORDER BY line")
+    for row in cursor.fetchall():
+        if row["number"] or stream is None:
+            stream = row["line"]
+        stream_of_line[row["line"]] = stream
+        if row["game"] and row["game"] not in games_by_stream[stream]:
+            games_by_stream[stream].append(row["game"])
+
+    cursor.execute("SELECT vods.vod_id, m.stream_line FROM vods LEFT JOIN vod_mapping m ON m.vod_id = vods.vod_id")
+    updates = []
+    vod_games = []
+    for row in cursor.fetchall():
+        games = games_by_stream.get(stream_of_line.get(row["stream_line"]), [])
+        updates.append((" / ".join(games) or None, row["vod_id"]))
+        vod_games += [(row["vod_id"], game) for game in games]
+    with connection:
+        cursor.executemany("UPDATE vods SET game = ? WHERE vod_id = ?", updates)
+        cursor.execute("DELETE FROM vod_games")
+        cursor.executemany("INSERT INTO vod_games (vod, game) VALUES (?, ?)", vod_games)
+    print(f"Found games for {sum(1 for game, _ in updates if game)} of {len(updates)} vods")
+
+
+def build_vod_facets(connection):
+    cursor = connection.cursor()
+    cursor.execute("DROP TABLE IF EXISTS vod_facets")
+    cursor.execute(
+        """
+        CREATE TABLE vod_facets (
+            facet TEXT,
+            value TEXT,
+            vods INTEGER,
+            PRIMARY KEY (facet, value)
+        ) WITHOUT ROWID
+    """
+    )
+    cursor.execute(
+        """
+        INSERT INTO vod_facets (facet, value, vods)
+        SELECT 'year', substr(date, 1, 4), count(*) FROM vods WHERE date IS NOT NULL GROUP BY substr(date, 1, 4)
+        UNION ALL
+        SELECT 'game', game, count(*) FROM vod_games GROUP BY game
+    """
+    )
+    connection.commit()
 
-        date = splits[0]
-        date = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
 
-        cursor.execute("SELECT vod_id FROM vods WHERE vod_id = ?", (vod_id,))
-        existing_record = cursor.fetchone()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transcripts", type=Path, default=Path(R"D:\Downloads\joe\transcripts"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch-size", type=int, default=100, help="files per transaction")
+    parser.add_argument("--vod-files", action="store_true", help="also export a compressed transcript file per vod")
+    parser.add_argument("--inverted-index", action="store_true", help="also export the static sharded inverted index")
+    parser.add_argument("--positional-index", action="store_true", help="also export the positional index for phrase and proximity search")
+    args = parser.parse_args()
 
-        if existing_record:
-            continue
-            # print(f"File {vod_id} already exists in the database. Skipping...")
-        else:
-            import_srt_to_sqlite(connection, cursor, file, vod_id)
-            cursor.execute("INSERT INTO vods (vod_id, title, date) VALUES (?,?,?)", (vod_id, title, date))
-            done_work = True
-    connection.commit()
+    connection, cursor = create_db()
+    files = sorted(args.transcripts.glob("*.srt"))
+    done_work = import_transcripts(connection, cursor, files, workers=args.workers, batch_size=args.batch_size) > 0
+    update_vod_speakers(connection)
 
+    reconcile.write_report(connection, reconcile.reconcile(connection))
     fill_vod_metadata(connection, cursor)
+    load_vod_games(connection, cursor)
     connection.close()
 
     if done_work:
-        export_db()
+        export_db(vod_files=args.vod_files, inverted_index=args.inverted_index, positional_index=args.positional_index)
         os.system("update_ghpages.bat")
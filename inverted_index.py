@@ -0,0 +1,490 @@
+"""
+A static, sharded inverted index over the transcripts. Every term's postings are the
+(vod, sub_index) lines it appears on, stored as varint deltas and grouped into shard files by the
+first characters of the term, so a client only downloads the shards for the words it searches for.
+
+Layout of the index directory:
+    manifest.<hash>.json  {"vods": [vod_id, ...], "shards": {prefix: file name}}
+    terms.<hash>.bin      records of varint(len(term)) term varint(len(postings)) postings
+
+Postings are varint(count) followed by, for each line, the vod number delta and the sub_index,
+which is a delta to the previous line when the vod didn't change.
+"""
+
+import bisect
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+
+PREFIX_LENGTH = 2
+WORD_PATTERN = re.compile(r"\w+")
+# what the index writers put in a directory, anything else there is left alone
+INDEX_FILE_PATTERNS = ("manifest.*.json", "terms.*.bin", "cues.*.bin", "*.tmp")
+
+
+def tokenize(text):
+    return WORD_PATTERN.findall(text.lower())
+
+
+def encode_varint(value, out):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def shard_prefix(term):
+    # hex keeps the file names safe whatever the script of the term
+    return term[:PREFIX_LENGTH].encode().hex()
+
+
+class PostingsWriter:
+    __slots__ = ("data", "count", "last_vod", "last_sub_index")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.count = 0
+        self.last_vod = 0
+        self.last_sub_index = 0
+
+    def add(self, vod, sub_index):
+        vod_delta = vod - self.last_vod
+        encode_varint(vod_delta, self.data)
+        encode_varint(sub_index - self.last_sub_index if vod_delta == 0 and self.count else sub_index, self.data)
+        self.count += 1
+        self.last_vod = vod
+        self.last_sub_index = sub_index
+
+    def to_bytes(self):
+        out = bytearray()
+        encode_varint(self.count, out)
+        return out + self.data
+
+
+def decode_postings(data):
+    count, pos = decode_varint(data, 0)
+    postings = []
+    vod = 0
+    sub_index = 0
+    for i in range(count):
+        vod_delta, pos = decode_varint(data, pos)
+        value, pos = decode_varint(data, pos)
+        vod += vod_delta
+        sub_index = sub_index + value if vod_delta == 0 and i else value
+        postings.append((vod, sub_index))
+    return postings
+
+
+def write_content_addressed(dir, prefix, suffix, data):
+    # an existing file is skipped, so it must never be half written: write a temporary file and
+    # rename it, which is atomic
+    name = f"{prefix}.{hashlib.sha256(data).hexdigest()[:16]}.{suffix}"
+    path = Path(dir) / name
+    if not path.exists():
+        tmp_path = Path(f"{path}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    return name
+
+
+def write_shards(dir, writers):
+    shards = {}
+    for term in sorted(writers):
+        shard = shards.setdefault(shard_prefix(term), bytearray())
+        term_bytes = term.encode()
+        postings = writers[term].to_bytes()
+        encode_varint(len(term_bytes), shard)
+        shard += term_bytes
+        encode_varint(len(postings), shard)
+        shard += postings
+    return {prefix: write_content_addressed(dir, "terms", "bin", shard) for prefix, shard in shards.items()}
+
+
+def write_manifest(dir, manifest):
+    data = json.dumps(manifest, separators=(",", ":"), sort_keys=True).encode()
+    manifest_name = write_content_addressed(dir, "manifest", "json", data)
+
+    # any other index file in the directory is from an older export
+    keep = set(manifest["shards"].values()) | {manifest.get("cues"), manifest_name}
+    for item in Path(dir).iterdir():
+        if item.is_file() and item.name not in keep and any(fnmatch.fnmatch(item.name, pattern) for pattern in INDEX_FILE_PATTERNS):
+            item.unlink()
+    return manifest_name
+
+
+def read_vods(cursor):
+    cursor.execute("SELECT vod_id FROM vods ORDER BY date, vod_id")
+    vod_ids = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        """
+        SELECT vod, sub_index, content FROM transcripts
+        JOIN vods ON transcripts.vod = vods.vod_id
+        ORDER BY vods.date, vods.vod_id, sub_index
+    """
+    )
+    return vod_ids, cursor
+
+
+def write_inverted_index(file, dir):
+    os.makedirs(dir, exist_ok=True)
+    connection = sqlite3.connect(file)
+    vod_ids, lines = read_vods(connection.cursor())
+    vod_numbers = {vod_id: number for number, vod_id in enumerate(vod_ids)}
+
+    writers = {}
+    for vod, sub_index, content in lines:
+        for term in set(tokenize(content)):
+            if term not in writers:
+                writers[term] = PostingsWriter()
+            writers[term].add(vod_numbers[vod], sub_index)
+    connection.close()
+
+    return write_manifest(dir, {"vods": vod_ids, "shards": write_shards(dir, writers)})
+
+
+def write_positional_index(file, dir):
+    """
+    Like write_inverted_index, but postings are (vod, position) for every occurrence of a term,
+    with positions counted across the whole vod so phrases that run over a cue boundary are found.
+    The cues file holds, per vod, varint(count) followed by each cue's sub_index delta and its
+    number of tokens, the manifest gives the byte range of each vod in it.
+    """
+    os.makedirs(dir, exist_ok=True)
+    connection = sqlite3.connect(file)
+    vod_ids, lines = read_vods(connection.cursor())
+    vod_numbers = {vod_id: number for number, vod_id in enumerate(vod_ids)}
+
+    writers = {}
+    cues = bytearray()
+    cue_ranges = {}
+    current_vod = None
+    vod_cues = []
+
+    def flush_cues():
+        start = len(cues)
+        encode_varint(len(vod_cues), cues)
+        last_sub_index = 0
+        for sub_index, token_count in vod_cues:
+            encode_varint(sub_index - last_sub_index, cues)
+            encode_varint(token_count, cues)
+            last_sub_index = sub_index
+        cue_ranges[current_vod] = [start, len(cues) - start]
+
+    position = 0
+    for vod, sub_index, content in lines:
+        if vod != current_vod:
+            if current_vod is not None:
+                flush_cues()
+            current_vod = vod
+            vod_cues = []
+            position = 0
+        tokens = tokenize(content)
+        vod_cues.append((sub_index, len(tokens)))
+        for term in tokens:
+            if term not in writers:
+                writers[term] = PostingsWriter()
+            writers[term].add(vod_numbers[vod], position)
+            position += 1
+    if current_vod is not None:
+        flush_cues()
+    connection.close()
+
+    manifest = {
+        "vods": vod_ids,
+        "shards": write_shards(dir, writers),
+        "cues": write_content_addressed(dir, "cues", "bin", cues),
+        "cue_ranges": [cue_ranges.get(vod_id, [0, 0]) for vod_id in vod_ids],
+    }
+    return write_manifest(dir, manifest)
+
+
+class InvertedIndex:
+    """
+    Reference query engine for the static index, reading shards the way a client would and
+    keeping track of how many bytes that took.
+    """
+
+    def __init__(self, dir, manifest_name):
+        self.dir = Path(dir)
+        manifest_path = self.dir / manifest_name
+        self.bytes_read = manifest_path.stat().st_size
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        self.vods = manifest["vods"]
+        self.shards = manifest["shards"]
+        self.loaded_shards = {}
+
+    def load_shard(self, prefix):
+        if prefix not in self.loaded_shards:
+            terms = {}
+            name = self.shards.get(prefix)
+            if name:
+                data = (self.dir / name).read_bytes()
+                self.bytes_read += len(data)
+                pos = 0
+                while pos < len(data):
+                    length, pos = decode_varint(data, pos)
+                    term = data[pos : pos + length].decode()
+                    pos += length
+                    length, pos = decode_varint(data, pos)
+                    terms[term] = data[pos : pos + length]
+                    pos += length
+            self.loaded_shards[prefix] = terms
+        return self.loaded_shards[prefix]
+
+    def postings(self, term):
+        data = self.load_shard(shard_prefix(term)).get(term)
+        return decode_postings(data) if data else []
+
+    def search(self, query):
+        """
+        Lines containing every word of the query, as (vod_id, sub_index) sorted like the index.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        lines = None
+        for term in sorted(set(terms)):
+            postings = set(self.postings(term))
+            lines = postings if lines is None else lines & postings
+            if not lines:
+                return []
+        return [(self.vods[vod], sub_index) for vod, sub_index in sorted(lines)]
+
+
+def sqlite_word_search(cursor, query):
+    """
+    The same lines found through the SQLite database: substring matches from the FTS index,
+    narrowed down to lines that contain every query word as a whole word.
+    """
+    terms = set(tokenize(query))
+    if not terms:
+        return []
+    # like only folds ascii case, other terms are left to the python check
+    like_terms = [term for term in terms if term.isascii()]
+    where = " and ".join(["1"] + ["transcripts.rowid in (select rowid from transcripts_fts where transcripts_fts.content like ?)" for _ in like_terms])
+    cursor.execute(
+        f"""
+        select vod, sub_index, content from transcripts
+        join vods on transcripts.vod = vods.vod_id
+        where {where}
+        order by vods.date, vods.vod_id, sub_index
+    """,
+        [f"%{term}%" for term in like_terms],
+    )
+    return [(vod, sub_index) for vod, sub_index, content in cursor.fetchall() if terms <= set(tokenize(content))]
+
+
+def check_parity(cursor, index, queries):
+    mismatches = []
+    for query in queries:
+        if index.search(query) != sqlite_word_search(cursor, query):
+            mismatches.append(query)
+    return mismatches
+
+
+QUERY_TOKEN = re.compile(r'"[^"]*"|\(|\)|NEAR(?:/\d+)?(?=\s|\(|$)|[^\s()"]+')
+DEFAULT_NEAR_DISTANCE = 10
+OPERATORS = ("AND", "OR", "NOT")
+NEAR_OPERATOR = re.compile(r"NEAR(?:/\d+)?")
+
+
+class PositionalIndex(InvertedIndex):
+    """
+    Query engine for the positional index. Queries support "exact phrases", a NEAR/k b (at most
+    k words between the two), AND, OR, NOT and parentheses, with AND implied between terms.
+    AND, OR and NOT combine whole vods, every match keeps the cue range it was found in.
+    NOT only excludes ("a NOT b"), an operator without a term on both sides raises ValueError.
+    """
+
+    def __init__(self, dir, manifest_name):
+        super().__init__(dir, manifest_name)
+        with open(self.dir / manifest_name) as f:
+            manifest = json.load(f)
+        self.cues_name = manifest["cues"]
+        self.cue_ranges = manifest["cue_ranges"]
+        self.loaded_cues = {}
+
+    def cue_starts(self, vod):
+        # token position each cue starts at, and its sub_index
+        if vod not in self.loaded_cues:
+            offset, length = self.cue_ranges[vod]
+            with open(self.dir / self.cues_name, "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+            self.bytes_read += length
+            count, pos = decode_varint(data, 0)
+            starts = []
+            sub_indexes = []
+            sub_index = 0
+            position = 0
+            for _ in range(count):
+                delta, pos = decode_varint(data, pos)
+                token_count, pos = decode_varint(data, pos)
+                sub_index += delta
+                starts.append(position)
+                sub_indexes.append(sub_index)
+                position += token_count
+            self.loaded_cues[vod] = (starts, sub_indexes)
+        return self.loaded_cues[vod]
+
+    def sub_index_at(self, vod, position):
+        starts, sub_indexes = self.cue_starts(vod)
+        return sub_indexes[bisect.bisect_right(starts, position) - 1]
+
+    def term_matches(self, term):
+        matches = defaultdict(list)
+        for vod, position in self.postings(term):
+            matches[vod].append((position, position))
+        return matches
+
+    def phrase_matches(self, terms):
+        if not terms:
+            return {}
+        matches = self.term_matches(terms[0])
+        for offset, term in enumerate(terms[1:], 1):
+            following = self.term_matches(term)
+            narrowed = {}
+            for vod, spans in matches.items():
+                positions = {position for position, _ in following.get(vod, ())}
+                kept = [(start, end + 1) for start, end in spans if start + offset in positions]
+                if kept:
+                    narrowed[vod] = kept
+            matches = narrowed
+        return matches
+
+    def near_matches(self, left, right, distance):
+        """
+        Pairs of spans with at most distance words between them. Both lists are sorted by start,
+        so for each left span only the right spans starting close to it are looked at, the lower
+        end of that window only ever moves forward.
+        """
+        matches = {}
+        for vod in left.keys() & right.keys():
+            right_spans = right[vod]
+            longest = max(end - start for start, end in right_spans)
+            spans = []
+            low = 0
+            for left_start, left_end in left[vod]:
+                # a right span starting before this can't end within distance of left_start
+                while low < len(right_spans) and right_spans[low][0] < left_start - distance - 1 - longest:
+                    low += 1
+                i = low
+                while i < len(right_spans) and right_spans[i][0] <= left_end + distance + 1:
+                    right_start, right_end = right_spans[i]
+                    gap = max(right_start - left_end, left_start - right_end) - 1
+                    if gap <= distance:
+                        spans.append((min(left_start, right_start), max(left_end, right_end)))
+                    i += 1
+            if spans:
+                matches[vod] = sorted(set(spans))
+        return matches
+
+    def parse(self, query):
+        tokens = QUERY_TOKEN.findall(query)
+        pos = 0
+
+        def peek():
+            return tokens[pos] if pos < len(tokens) else None
+
+        def take():
+            nonlocal pos
+            pos += 1
+            return tokens[pos - 1]
+
+        def primary():
+            token = peek()
+            if token is None or token in OPERATORS or NEAR_OPERATOR.fullmatch(token) or token == ")":
+                raise ValueError(f"Expected a term at {'the end' if token is None else repr(token)} in query {query!r}")
+            take()
+            if token == "(":
+                node = or_expr()
+                if peek() != ")":
+                    raise ValueError(f"Missing ) in query {query!r}")
+                take()
+                return node
+            # a single word that tokenizes into several ("don't") is matched as a phrase
+            return ("phrase", tokenize(token.strip('"')))
+
+        def near_expr():
+            node = primary()
+            while peek() is not None and NEAR_OPERATOR.fullmatch(peek()):
+                distance = int(take()[5:] or DEFAULT_NEAR_DISTANCE)
+                node = ("near", node, primary(), distance)
+            return node
+
+        def not_expr():
+            node = near_expr()
+            while peek() == "NOT":
+                take()
+                node = ("not", node, near_expr())
+            return node
+
+        def and_expr():
+            node = not_expr()
+            while peek() is not None and peek() not in ("OR", ")"):
+                if peek() == "AND":
+                    take()
+                node = ("and", node, not_expr())
+            return node
+
+        def or_expr():
+            node = and_expr()
+            while peek() == "OR":
+                take()
+                node = ("or", node, and_expr())
+            return node
+
+        if not tokens:
+            return None
+        node = or_expr()
+        if peek() is not None:
+            raise ValueError(f"Unexpected {peek()!r} in query {query!r}")
+        return node
+
+    def evaluate(self, node):
+        kind = node[0]
+        if kind == "phrase":
+            return self.phrase_matches(node[1])
+        if kind == "near":
+            return self.near_matches(self.evaluate(node[1]), self.evaluate(node[2]), node[3])
+        left = self.evaluate(node[1])
+        right = self.evaluate(node[2])
+        if kind == "and":
+            return {vod: sorted(set(left[vod] + right[vod])) for vod in left.keys() & right.keys()}
+        if kind == "or":
+            return {vod: sorted(set(left.get(vod, []) + right.get(vod, []))) for vod in left.keys() | right.keys()}
+        if kind == "not":
+            return {vod: spans for vod, spans in left.items() if vod not in right}
+        raise ValueError(f"Unknown query node {kind}")
+
+    def search(self, query):
+        """
+        Matches as (vod_id, first sub_index, last sub_index), in index order. Matches that fall in
+        the same cues (two hits in one line, spans merged by AND/OR) are returned once.
+        """
+        node = self.parse(query)
+        if node is None:
+            return []
+        results = {}
+        for vod, spans in sorted(self.evaluate(node).items()):
+            for start, end in spans:
+                results[(self.vods[vod], self.sub_index_at(vod, start), self.sub_index_at(vod, end))] = None
+        return list(results)
@@ -0,0 +1,38 @@
+"""
+static/sqlite.worker.js is the worker from sql.js-httpvfs with one change: in chunked mode the
+chunk urls come from config["chunkNames"] when it is set, so export_chunks can name chunks by
+their content hash. This script redoes that change on a fresh copy of the worker, run it after
+updating sql.js-httpvfs:
+
+    yarn install
+    python patch_worker.py
+
+The source map comment is dropped, the map shipped with the package doesn't match the patched
+file.
+"""
+
+import argparse
+from pathlib import Path
+
+ORIGINAL = 'url:e.urlPrefix+String(n).padStart(e.suffixLength,"0")+l'
+PATCHED = 'url:e.urlPrefix+(e.chunkNames?e.chunkNames[n]:String(n).padStart(e.suffixLength,"0"))+l'
+SOURCE_MAP = "//# sourceMappingURL=sqlite.worker.js.map"
+
+
+def patch_worker(source):
+    if PATCHED in source:
+        return source
+    if source.count(ORIGINAL) != 1:
+        raise ValueError("The chunk url code wasn't found in the worker, sql.js-httpvfs changed and the patch needs updating")
+    source = source.replace(ORIGINAL, PATCHED)
+    return "\n".join(line for line in source.split("\n") if line.strip() != SOURCE_MAP)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--source", type=Path, default=Path("node_modules/sql.js-httpvfs/dist/sqlite.worker.js"))
+    parser.add_argument("--target", type=Path, default=Path("static/sqlite.worker.js"))
+    args = parser.parse_args()
+
+    args.target.write_text(patch_worker(args.source.read_text(encoding="utf-8")), encoding="utf-8")
+    print(f"Patched {args.source} into {args.target}")
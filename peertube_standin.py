@@ -0,0 +1,148 @@
+"""
+A local stand-in for the parts of the PeerTube API that import_peertube.py uses, so the sync
+can be run without touching the live instance:
+
+    python peertube_standin.py --videos 2000 --error-rate 0.05
+    PEERTUBE_URL=http://localhost:9000 python import_peertube.py
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_catalog(video_count):
+    videos = []
+    for i in range(video_count):
+        created = f"2020-01-01T00:00:00.{i:06d}Z"
+        twitch = i % 2 == 0
+        videos.append(
+            {
+                "id": i + 1,
+                "name": f"Video {i + 1}",
+                "description": "",
+                "duration": 3600 + i,
+                "views": i,
+                "likes": 0,
+                "dislikes": 0,
+                "nsfw": False,
+                "thumbnailPath": f"/static/thumbnails/{i + 1}.jpg",
+                "createdAt": created,
+                "publishedAt": created,
+                "updatedAt": created,
+                "originallyPublishedAt": None,
+                "channel": {"name": "archive", "id": 1},
+                "privacy": {"id": 1},
+                "url": f"http://localhost/w/{i + 1}",
+                "filename": f"20200101 - Video {i + 1} - v{i + 1}.mp4" if twitch else f"20200101 - Video {i + 1} {i + 1:011d}.mp4",
+            }
+        )
+    # the api lists newest first
+    videos.reverse()
+    return videos
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    catalog = []
+    videos_by_id = {}
+    latency = 0.0
+    error_rate = 0.0
+    lock = threading.Lock()
+    request_count = 0
+
+    def send_json(self, status, data=None, headers=None):
+        body = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method):
+        with self.lock:
+            StandInHandler.request_count += 1
+        time.sleep(self.latency)
+        if random.random() < self.error_rate:
+            status = random.choice((429, 503))
+            return self.send_json(status, {"error": "try again"}, {"Retry-After": "0"})
+
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        path = url.path
+
+        if method == "GET" and path == "/api/v1/oauth-clients/local":
+            return self.send_json(200, {"client_id": "standin", "client_secret": "standin"})
+        if method == "POST" and path == "/api/v1/users/token":
+            return self.send_json(200, {"access_token": "standin"})
+        if method == "GET" and path == "/api/v1/videos":
+            start = int(params.get("start", 0))
+            count = int(params.get("count", 15))
+            page = [{k: v for k, v in video.items() if k != "filename"} for video in self.catalog[start : start + count]]
+            return self.send_json(200, {"total": len(self.catalog), "data": page})
+        if method == "GET" and path == "/api/v1/users/me/videos/imports":
+            start = int(params.get("start", 0))
+            count = int(params.get("count", 15))
+            imports = [
+                {"video": {"id": video["id"]}, "targetUrl": f"https://www.twitch.tv/videos/v{video['id']}"}
+                for video in self.catalog
+                if video["id"] % 2 == 1
+            ]
+            return self.send_json(200, {"total": len(imports), "data": imports[start : start + count]})
+
+        match = re.fullmatch(r"/api/v1/videos/([^/]+)(/source)?", path)
+        if match and match.group(1) in self.videos_by_id:
+            video = self.videos_by_id[match.group(1)]
+            if match.group(2):
+                return self.send_json(200, {"filename": video["filename"]})
+            if method == "GET":
+                return self.send_json(200, {k: v for k, v in video.items() if k != "filename"})
+            if method == "PUT":
+                length = int(self.headers.get("Content-Length", 0))
+                data = json.loads(self.rfile.read(length) or b"{}")
+                with self.lock:
+                    video.update(data)
+                    video["updatedAt"] = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+                return self.send_json(204)
+
+        return self.send_json(404, {"error": "not found"})
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_PUT(self):
+        self.handle_request("PUT")
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--videos", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 429 or 503")
+    args = parser.parse_args()
+
+    StandInHandler.catalog = make_catalog(args.videos)
+    StandInHandler.videos_by_id = {str(video["id"]): video for video in StandInHandler.catalog}
+    StandInHandler.latency = args.latency
+    StandInHandler.error_rate = args.error_rate
+
+    server = ThreadingHTTPServer(("localhost", args.port), StandInHandler)
+    print(f"Serving {args.videos} videos on http://localhost:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{StandInHandler.request_count} requests served")
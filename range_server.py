@@ -0,0 +1,179 @@
+"""
+Serves the static folder the way GitHub Pages does for the chunked database: single byte ranges,
+ETags and conditional requests, with added latency and bandwidth limits so the request waterfall
+of a search can be looked at without publishing:
+
+    python range_server.py --latency 0.08 --bandwidth 2000
+    python range_server.py --log ranges.jsonl
+
+Every response is logged with its path, range, size and duration.
+"""
+
+import argparse
+import json
+import mimetypes
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+WRITE_BLOCK_SIZE = 16 * 1024
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    root = Path("static")
+    latency = 0.0
+    bandwidth = 0
+    log_file = None
+    lock = threading.Lock()
+    request_count = 0
+    bytes_sent = 0
+
+    def resolve(self, url_path):
+        path = (self.root / unquote(url_path).lstrip("/")).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            return None
+        if path.is_dir():
+            path = path / "index.html"
+        return path if path.is_file() else None
+
+    def send_headers(self, status, headers):
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "Content-Range, Content-Length, ETag, Accept-Ranges")
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+
+    def write_throttled(self, f, length):
+        sent = 0
+        start = time.perf_counter()
+        while sent < length:
+            data = f.read(min(WRITE_BLOCK_SIZE, length - sent))
+            if not data:
+                break
+            self.wfile.write(data)
+            sent += len(data)
+            if self.bandwidth:
+                ahead = sent / (self.bandwidth * 1024) - (time.perf_counter() - start)
+                if ahead > 0:
+                    time.sleep(ahead)
+        return sent
+
+    def log_range(self, status, path, byte_range, sent, started):
+        entry = {
+            "time": round(started, 3),
+            "status": status,
+            "path": path,
+            "range": byte_range,
+            "bytes": sent,
+            "ms": round((time.time() - started) * 1000, 1),
+        }
+        with self.lock:
+            RangeHandler.request_count += 1
+            RangeHandler.bytes_sent += sent
+            if self.log_file:
+                self.log_file.write(json.dumps(entry) + "\n")
+                self.log_file.flush()
+        range_text = f"{byte_range[0]}-{byte_range[1]}" if byte_range else "full"
+        print(f"{status} {path} {range_text} {sent} bytes {entry['ms']} ms")
+
+    def handle_request(self, send_body):
+        started = time.time()
+        time.sleep(self.latency)
+        url_path = urlparse(self.path).path
+        path = self.resolve(url_path)
+        if path is None:
+            self.send_headers(404, {"Content-Length": "0"})
+            return self.log_range(404, url_path, None, 0, started)
+
+        stat = path.stat()
+        size = stat.st_size
+        etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+        headers = {
+            "Content-Type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "Accept-Ranges": "bytes",
+            "ETag": etag,
+            "Cache-Control": "max-age=600",
+        }
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_headers(304, headers)
+            return self.log_range(304, url_path, None, 0, started)
+
+        byte_range = None
+        match = RANGE.fullmatch(self.headers.get("Range", "").strip())
+        if_range = self.headers.get("If-Range")
+        if match and (if_range is None or if_range == etag):
+            first, last = match.groups()
+            if first:
+                first = int(first)
+                last = min(int(last), size - 1) if last else size - 1
+            elif last:
+                # suffix range, the last n bytes
+                first = max(size - int(last), 0)
+                last = size - 1
+            else:
+                first, last = 0, size - 1
+            if first >= size or first > last:
+                self.send_headers(416, {"Content-Range": f"bytes */{size}", "Content-Length": "0"})
+                return self.log_range(416, url_path, [first, last], 0, started)
+            byte_range = [first, last]
+
+        if byte_range:
+            status = 206
+            headers["Content-Range"] = f"bytes {byte_range[0]}-{byte_range[1]}/{size}"
+            length = byte_range[1] - byte_range[0] + 1
+        else:
+            status = 200
+            length = size
+        headers["Content-Length"] = str(length)
+        self.send_headers(status, headers)
+
+        sent = 0
+        if send_body:
+            with open(path, "rb") as f:
+                f.seek(byte_range[0] if byte_range else 0)
+                sent = self.write_throttled(f, length)
+        self.log_range(status, url_path, byte_range, sent, started)
+
+    def do_GET(self):
+        self.handle_request(True)
+
+    def do_HEAD(self):
+        self.handle_request(False)
+
+    def do_OPTIONS(self):
+        self.send_headers(204, {"Access-Control-Allow-Headers": "Range, If-None-Match, If-Range", "Content-Length": "0"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--root", type=Path, default=Path("static"), help="folder to serve, with data.json and the data-* chunk folders")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added before every response")
+    parser.add_argument("--bandwidth", type=int, default=0, help="KB/s per response, 0 for unlimited")
+    parser.add_argument("--log", type=Path, default=None, help="also write every response as a json line to this file")
+    args = parser.parse_args()
+
+    RangeHandler.root = args.root
+    RangeHandler.latency = args.latency
+    RangeHandler.bandwidth = args.bandwidth
+    if args.log:
+        RangeHandler.log_file = open(args.log, "a")
+
+    server = ThreadingHTTPServer(("localhost", args.port), RangeHandler)
+    print(f"Serving {args.root} on http://localhost:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{RangeHandler.request_count} responses, {RangeHandler.bytes_sent / 1024:.0f} KB sent")
+    finally:
+        if RangeHandler.log_file:
+            RangeHandler.log_file.close()
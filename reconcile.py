@@ -0,0 +1,319 @@
+"""
+Matches the vods from every source against each other once, after the imports:
+
+- transcripts (vods in data.db),
+- peertube videos (peertube_videos in data.db, from import_peertube.py),
+- youtube uploads (videos in data_yt.db, from spreadsheet_get_ytdata.py), by id or, for mirrors
+  of twitch streams, by date and a duration within tolerance,
+- spreadsheet rows (streams in data.db), by youtube link or date.
+
+The result is the vod_mapping table, one row per external id, and a report of everything that
+didn't match. External ids all have the form twitch:v<id> or youtube:<id> and are derived here.
+It runs before the vod metadata and games are filled in, which look their matches up in
+vod_mapping instead of matching again.
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+
+import spreadsheet
+
+TWITCH_VOD_ID = re.compile(r"^v\d+$")
+TWITCH_URL = re.compile(r"v(\d+)(?:\.mp4)?$")
+YOUTUBE_URL = re.compile(r"(?:youtu\.be/|youtube\.com/(?:embed/|v/|watch\?v=|watch\?.+&v=))([^&?/]+)")
+TWITCH_FILENAME = re.compile(r"v(\d+)\.mp4$")
+YOUTUBE_FILENAME = re.compile(r" ([A-Za-z0-9_-]{11})$")
+
+# a mirror may be cut a little differently from the stream it copies
+DURATION_TOLERANCE = 120
+DURATION_TOLERANCE_RATIO = 0.02
+
+
+def external_id_from_vod_id(vod_id):
+    # transcript files are named after the twitch vod or youtube video
+    if TWITCH_VOD_ID.match(vod_id):
+        return "twitch:" + vod_id
+    return "youtube:" + vod_id
+
+
+def external_id_from_url(url):
+    twitch_match = TWITCH_URL.search(url)
+    if twitch_match:
+        return f"twitch:v{twitch_match.group(1)}"
+    youtube_match = YOUTUBE_URL.search(url)
+    if youtube_match:
+        return f"youtube:{youtube_match.group(1)}"
+    return None
+
+
+def external_id_from_filename(filename):
+    twitch_match = TWITCH_FILENAME.search(filename)
+    if twitch_match:
+        return f"twitch:v{twitch_match.group(1)}"
+    youtube_match = YOUTUBE_FILENAME.search(filename.rsplit(".", 1)[0])
+    if youtube_match:
+        return f"youtube:{youtube_match.group(1)}"
+    return None
+
+
+def table_exists(cursor, name, schema="main"):
+    cursor.execute(f"SELECT 1 FROM {schema}.sqlite_master WHERE type = 'table' AND name = ?", (name,))
+    return cursor.fetchone() is not None
+
+
+def durations_match(a, b):
+    return abs(a - b) <= max(DURATION_TOLERANCE, DURATION_TOLERANCE_RATIO * max(a, b))
+
+
+def create_tables(cursor):
+    cursor.execute("DROP TABLE IF EXISTS vod_sources")
+    cursor.execute(
+        """
+        CREATE TABLE vod_sources (
+            source TEXT,
+            key TEXT,
+            external_id TEXT,
+            date TEXT,
+            duration INTEGER,
+            PRIMARY KEY (source, key)
+        ) WITHOUT ROWID
+    """
+    )
+    cursor.execute("CREATE INDEX vod_sources_external_id ON vod_sources (external_id, source)")
+    cursor.execute("CREATE INDEX vod_sources_date ON vod_sources (date, source)")
+
+    cursor.execute("DROP TABLE IF EXISTS vod_mapping")
+    cursor.execute(
+        """
+        CREATE TABLE vod_mapping (
+            external_id TEXT PRIMARY KEY,
+            date TEXT,
+            duration INTEGER,
+            vod_id TEXT,
+            peertube_id TEXT,
+            youtube_id TEXT,
+            youtube_match TEXT,
+            stream_line INTEGER,
+            stream_match TEXT
+        )
+    """
+    )
+    cursor.execute("CREATE INDEX vod_mapping_vod_id ON vod_mapping (vod_id)")
+    cursor.execute("CREATE INDEX vod_mapping_peertube_id ON vod_mapping (peertube_id)")
+    cursor.execute("CREATE INDEX vod_mapping_youtube_id ON vod_mapping (youtube_id)")
+
+
+def fill_peertube_external_ids(connection, cursor):
+    # rows synced before external ids were stored, or with a filename the sync couldn't read
+    cursor.execute("SELECT id, source_url, original_filename FROM peertube_videos WHERE external_id IS NULL AND manual_id IS NULL")
+    updates = []
+    for row in cursor.fetchall():
+        external_id = (row["source_url"] and external_id_from_url(row["source_url"])) or (row["original_filename"] and external_id_from_filename(row["original_filename"]))
+        if external_id:
+            updates.append((external_id, row["id"]))
+    with connection:
+        cursor.executemany("UPDATE peertube_videos SET external_id = ? WHERE id = ?", updates)
+    return len(updates)
+
+
+def load_sources(connection, cursor, youtube=False):
+    with connection:
+        cursor.execute(
+            """
+            INSERT INTO vod_sources (source, key, external_id, date, duration)
+            SELECT 'transcript', vod_id, external_id, date, (SELECT max(end_ms) / 1000 FROM transcripts WHERE vod = vod_id)
+            FROM vods
+        """
+        )
+        if table_exists(cursor, "peertube_videos"):
+            cursor.execute(
+                """
+                INSERT INTO vod_sources (source, key, external_id, date, duration)
+                SELECT 'peertube', id, coalesce(manual_id, external_id), substr(coalesce(original_publish_date, publishedAt), 1, 10), duration
+                FROM peertube_videos
+            """
+            )
+        if youtube:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO vod_sources (source, key, external_id, date, duration)
+                SELECT 'youtube', video_id, 'youtube:' || video_id,
+                    substr(vod_date, 1, 4) || '-' || substr(vod_date, 5, 2) || '-' || substr(vod_date, 7, 2), duration
+                FROM yt.videos
+            """
+            )
+
+
+def build_mapping(connection, cursor):
+    with connection:
+        cursor.execute(
+            """
+            INSERT INTO vod_mapping (external_id, date, duration, vod_id, peertube_id, youtube_id, youtube_match)
+            SELECT
+                ids.external_id,
+                coalesce(t.date, p.date),
+                coalesce(p.duration, t.duration),
+                t.key,
+                p.key,
+                y.key,
+                CASE WHEN y.key IS NOT NULL THEN 'id' END
+            FROM (
+                SELECT DISTINCT external_id FROM vod_sources
+                WHERE source IN ('transcript', 'peertube') AND external_id IS NOT NULL
+            ) ids
+            LEFT JOIN vod_sources t ON t.external_id = ids.external_id AND t.source = 'transcript'
+            LEFT JOIN vod_sources p ON p.external_id = ids.external_id AND p.source = 'peertube'
+            LEFT JOIN vod_sources y ON y.external_id = ids.external_id AND y.source = 'youtube'
+            GROUP BY ids.external_id
+        """
+        )
+
+
+def match_youtube_mirrors(connection, cursor):
+    """
+    Streams without their own youtube upload get the upload from the same day whose duration is
+    closest, if it is within tolerance. Uploads that already belong to a vod are not reused.
+    """
+    cursor.execute(
+        """
+        SELECT key, date, duration FROM vod_sources
+        WHERE source = 'youtube' AND duration IS NOT NULL
+            AND key NOT IN (SELECT youtube_id FROM vod_mapping WHERE youtube_id IS NOT NULL)
+    """
+    )
+    uploads_by_date = defaultdict(list)
+    for row in cursor.fetchall():
+        uploads_by_date[row["date"]].append((row["key"], row["duration"]))
+
+    cursor.execute("SELECT external_id, date, duration FROM vod_mapping WHERE youtube_id IS NULL AND date IS NOT NULL AND duration IS NOT NULL ORDER BY date, external_id")
+    updates = []
+    mismatches = []
+    claimed = set()
+    for row in cursor.fetchall():
+        uploads = [(video_id, duration) for video_id, duration in uploads_by_date.get(row["date"], []) if video_id not in claimed]
+        if not uploads:
+            continue
+        candidates = sorted((abs(duration - row["duration"]), video_id) for video_id, duration in uploads if durations_match(duration, row["duration"]))
+        if not candidates:
+            mismatches.append({"external_id": row["external_id"], "date": row["date"], "duration": row["duration"], "uploads": dict(uploads)})
+            continue
+        claimed.add(candidates[0][1])
+        updates.append((candidates[0][1], row["external_id"]))
+
+    with connection:
+        cursor.executemany("UPDATE vod_mapping SET youtube_id = ?, youtube_match = 'date' WHERE external_id = ?", updates)
+    return mismatches
+
+
+def match_streams(connection, cursor):
+    # a link to the vod itself first, then to its youtube mirror, then the first stream that day
+    with connection:
+        cursor.execute(
+            """
+            UPDATE vod_mapping SET stream_line = s.line, stream_match = 'id'
+            FROM (SELECT video_id, min(line) AS line FROM stream_videos GROUP BY video_id) s
+            WHERE vod_mapping.external_id = 'youtube:' || s.video_id
+        """
+        )
+        cursor.execute(
+            """
+            UPDATE vod_mapping SET stream_line = s.line, stream_match = 'id'
+            FROM (SELECT video_id, min(line) AS line FROM stream_videos GROUP BY video_id) s
+            WHERE vod_mapping.stream_line IS NULL AND vod_mapping.youtube_id = s.video_id
+        """
+        )
+        cursor.execute(
+            """
+            UPDATE vod_mapping SET stream_line = s.line, stream_match = 'date'
+            FROM (SELECT date, min(line) AS line FROM streams WHERE number != '' AND date IS NOT NULL GROUP BY date) s
+            WHERE vod_mapping.stream_line IS NULL AND vod_mapping.date = s.date
+        """
+        )
+
+
+def build_report(cursor, duration_mismatches, youtube=False):
+    report = {}
+
+    def collect(name, query):
+        cursor.execute(query)
+        report[name] = [dict(row) for row in cursor.fetchall()]
+
+    collect("transcripts_without_peertube", "SELECT vod_id, external_id, date FROM vod_mapping WHERE vod_id IS NOT NULL AND peertube_id IS NULL ORDER BY date")
+    collect("peertube_without_transcripts", "SELECT peertube_id, external_id, date FROM vod_mapping WHERE peertube_id IS NOT NULL AND vod_id IS NULL ORDER BY date")
+    collect("peertube_without_external_id", "SELECT key AS peertube_id, date FROM vod_sources WHERE source = 'peertube' AND external_id IS NULL ORDER BY date")
+    collect("external_ids_on_several_peertube_videos", "SELECT external_id, group_concat(key) AS peertube_ids FROM vod_sources WHERE source = 'peertube' AND external_id IS NOT NULL GROUP BY external_id HAVING count(*) > 1")
+    collect("without_stream_row", "SELECT external_id, vod_id, peertube_id, date FROM vod_mapping WHERE stream_line IS NULL ORDER BY date")
+    if youtube:
+        collect("without_youtube_upload", "SELECT external_id, vod_id, date, duration FROM vod_mapping WHERE youtube_id IS NULL ORDER BY date")
+        collect(
+            "spreadsheet_videos_not_fetched",
+            """
+            SELECT stream_videos.video_id, streams.line, streams.date FROM stream_videos JOIN streams USING (line)
+            WHERE NOT EXISTS (SELECT 1 FROM yt.videos WHERE yt.videos.video_id = stream_videos.video_id)
+            ORDER BY streams.line
+        """,
+        )
+        report["youtube_duration_mismatches"] = duration_mismatches
+    return report
+
+
+def reconcile(connection, youtube_db="data_yt.db", spreadsheet_file=spreadsheet.input_file):
+    # a cursor of our own, the caller's connection keeps its row factory
+    cursor = connection.cursor()
+    cursor.row_factory = sqlite3.Row
+
+    youtube = os.path.exists(youtube_db)
+    if youtube:
+        cursor.execute("ATTACH DATABASE ? AS yt", (youtube_db,))
+    else:
+        print(f"{youtube_db} not found, not matching youtube uploads")
+    spreadsheet.load_spreadsheet(connection, spreadsheet_file)
+
+    if table_exists(cursor, "peertube_videos"):
+        filled = fill_peertube_external_ids(connection, cursor)
+        if filled:
+            print(f"Found external ids for {filled} peertube videos")
+
+    with connection:
+        create_tables(cursor)
+    load_sources(connection, cursor, youtube)
+    build_mapping(connection, cursor)
+    duration_mismatches = match_youtube_mirrors(connection, cursor) if youtube else []
+    match_streams(connection, cursor)
+
+    report = build_report(cursor, duration_mismatches, youtube)
+    if youtube:
+        cursor.execute("DETACH DATABASE yt")
+    return report
+
+
+def write_report(connection, report, file="reconcile_report.json"):
+    cursor = connection.cursor()
+    cursor.execute("SELECT count(*), count(vod_id), count(peertube_id), count(youtube_id), count(stream_line) FROM vod_mapping")
+    total, transcripts, peertube, youtube, streams = cursor.fetchone()
+    print(f"{total} vods: {transcripts} with transcripts, {peertube} on peertube, {youtube} on youtube, {streams} in the spreadsheet")
+    for name, items in report.items():
+        if items:
+            print(f"{name}: {len(items)}")
+
+    with open(file, "w") as f:
+        json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", default="data.db")
+    parser.add_argument("--youtube-db", default="data_yt.db")
+    parser.add_argument("--spreadsheet", default=spreadsheet.input_file)
+    parser.add_argument("--report", type=Path, default=Path("reconcile_report.json"))
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(args.db)
+    report = reconcile(connection, args.youtube_db, args.spreadsheet)
+    write_report(connection, report, args.report)
+    connection.close()
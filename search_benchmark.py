@@ -0,0 +1,254 @@
+"""
+Measures what searches cost a browser client. The split database from export_chunks is opened
+through a VFS that serves reads the way sql.js-httpvfs does (whole request chunks, with read-ahead
+growing on sequential reads), and every query of a fixed corpus reports pages read, bytes
+transferred, request count and wall time. Results are written to JSON and can be compared with
+an earlier run to catch regressions before publishing:
+
+    python search_benchmark.py --output before.json
+    python search_benchmark.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import apsw
+
+import import_transcripts
+
+QUERIES = [
+    {"name": "rare term", "kind": "lines", "term": "xylophone"},
+    {"name": "rare term 2", "kind": "lines", "term": "antidisestablishment"},
+    {"name": "common term", "kind": "lines", "term": "game"},
+    {"name": "common term vod list", "kind": "vods", "term": "game"},
+    {"name": "very common term vod list", "kind": "vods", "term": "the"},
+    {"name": "phrase", "kind": "lines", "term": "dark souls"},
+    {"name": "long phrase", "kind": "lines", "term": "never gonna give you up"},
+    {"name": "date filtered", "kind": "lines", "term": "boss", "year": 2019},
+    {"name": "game filtered", "kind": "lines", "term": "boss", "game": "Elden Ring"},
+    {"name": "main speaker", "kind": "lines", "term": "chat", "speaker": "main"},
+]
+
+# sql.js-httpvfs defaults
+MAX_READ_HEADS = 3
+MAX_READ_SPEED = 5 * 1024 * 1024
+
+
+class RangeRequestStats:
+    def __init__(self):
+        self.pages = 0
+        self.bytes = 0
+        self.requests = 0
+        self.ranges = []
+
+
+class ChunkedFile:
+    """
+    Read-only database file made of the chunks in a config.json. Reads are cached per request
+    chunk, a miss fetches one range from one server chunk, twice as long as the last one when the
+    reads are sequential.
+    """
+
+    def __init__(self, dir, config, stats):
+        self.dir = Path(dir)
+        self.config = config
+        self.stats = stats
+        self.chunk_size = int(config["requestChunkSize"])
+        self.server_chunk_size = int(config["serverChunkSize"])
+        self.length = int(config["databaseLengthBytes"])
+        self.cache = {}
+        # [next chunk expected, chunks per request] for each sequential reader
+        self.read_heads = []
+
+    def chunk_path(self, server_chunk):
+        if "chunkNames" in self.config:
+            name = self.config["chunkNames"][server_chunk]
+        else:
+            name = str(server_chunk).zfill(int(self.config["suffixLength"]))
+        return self.dir / f"{self.config['urlPrefix']}{name}"
+
+    def fetch(self, chunk):
+        speed = 1
+        for head in self.read_heads:
+            if head[0] == chunk:
+                speed = min(head[1] * 2, MAX_READ_SPEED // self.chunk_size)
+                self.read_heads.remove(head)
+                break
+        chunks_per_server_chunk = self.server_chunk_size // self.chunk_size
+        server_chunk = chunk // chunks_per_server_chunk
+        last = min(chunk + speed, (server_chunk + 1) * chunks_per_server_chunk, -(-self.length // self.chunk_size))
+
+        start = chunk * self.chunk_size - server_chunk * self.server_chunk_size
+        length = (last - chunk) * self.chunk_size
+        with open(self.chunk_path(server_chunk), "rb") as f:
+            f.seek(start)
+            data = f.read(length)
+        for i in range(last - chunk):
+            self.cache[chunk + i] = data[i * self.chunk_size : (i + 1) * self.chunk_size]
+
+        self.stats.requests += 1
+        self.stats.bytes += len(data)
+        self.stats.ranges.append((chunk * self.chunk_size, chunk * self.chunk_size + len(data)))
+        self.read_heads.insert(0, [last, last - chunk])
+        del self.read_heads[MAX_READ_HEADS:]
+
+    def xRead(self, amount, offset):
+        self.stats.pages += 1
+        data = bytearray()
+        chunk = offset // self.chunk_size
+        while len(data) < amount and chunk * self.chunk_size < self.length:
+            if chunk not in self.cache:
+                self.fetch(chunk)
+            data += self.cache[chunk]
+            chunk += 1
+        skip = offset % self.chunk_size
+        result = bytes(data[skip : skip + amount])
+        if len(result) < amount:
+            raise apsw.IOError("short read")
+        return result
+
+    def xFileSize(self):
+        return self.length
+
+    def xWrite(self, data, offset):
+        raise apsw.ReadOnlyError()
+
+    def xTruncate(self, size):
+        raise apsw.ReadOnlyError()
+
+    def xSync(self, flags):
+        pass
+
+    def xLock(self, level):
+        pass
+
+    def xUnlock(self, level):
+        pass
+
+    def xCheckReservedLock(self):
+        return False
+
+    def xFileControl(self, op, pointer):
+        return False
+
+    def xSectorSize(self):
+        return 0
+
+    def xDeviceCharacteristics(self):
+        return 0
+
+    def xClose(self):
+        pass
+
+
+class ChunkedVFS(apsw.VFS):
+    def __init__(self, dir, config, stats, name="chunked"):
+        self.dir = dir
+        self.config = config
+        self.stats = stats
+        self.name = name
+        super().__init__(name, "")
+
+    def xOpen(self, name, flags):
+        return ChunkedFile(self.dir, self.config, self.stats)
+
+    def xAccess(self, pathname, flags):
+        return False
+
+    def xFullPathname(self, name):
+        return name
+
+    def xDelete(self, name, syncdir):
+        pass
+
+
+def run_query(cursor, query):
+    if query["kind"] == "vods":
+        return import_transcripts.search_vods(cursor, query["term"])
+    return import_transcripts.search_transcripts(
+        cursor,
+        query["term"],
+        speaker=query.get("speaker"),
+        year=query.get("year"),
+        game=query.get("game"),
+    )
+
+
+def benchmark(dir, config, queries):
+    results = []
+    for query in queries:
+        # a fresh connection and cache for every query, like a client opening the page
+        stats = RangeRequestStats()
+        vfs = ChunkedVFS(dir, config, stats)
+        connection = apsw.Connection("db.sqlite3", flags=apsw.SQLITE_OPEN_READONLY, vfs=vfs.name)
+        cursor = connection.cursor()
+        # sql.js keeps temporary tables in memory as well
+        cursor.execute("pragma temp_store = memory")
+        start = time.perf_counter()
+        rows = run_query(cursor, query)
+        elapsed = time.perf_counter() - start
+        connection.close()
+        vfs.unregister()
+
+        results.append(
+            {
+                **query,
+                "rows": len(rows),
+                "pages_read": stats.pages,
+                "bytes": stats.bytes,
+                "requests": stats.requests,
+                "seconds": round(elapsed, 4),
+            }
+        )
+        print(f"{query['name']}: {len(rows)} rows, {stats.pages} pages, {stats.bytes / 1024:.0f} KB in {stats.requests} requests, {elapsed * 1000:.0f} ms")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    baseline_by_name = {result["name"]: result for result in baseline["queries"]}
+    regressions = []
+    for result in results:
+        before = baseline_by_name.get(result["name"])
+        if before is None:
+            continue
+        for metric in ("bytes", "requests"):
+            if result[metric] > before[metric] * (1 + tolerance):
+                regressions.append(f"{result['name']}: {metric} {before[metric]} -> {result[metric]}")
+        if result["rows"] != before["rows"]:
+            regressions.append(f"{result['name']}: rows {before['rows']} -> {result['rows']}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--static", type=Path, default=Path("static"), help="folder with data.json")
+    parser.add_argument("--queries", type=Path, default=None, help="json list of queries to run instead of the built in corpus")
+    parser.add_argument("--output", type=Path, default=Path("search_benchmark.json"))
+    parser.add_argument("--compare", type=Path, default=None, help="earlier output to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed growth in bytes and requests")
+    args = parser.parse_args()
+
+    with open(args.static / "data.json") as f:
+        data = json.load(f)
+    dir = args.static / data["dir_name"]
+    with open(dir / data.get("config_name", "config.json")) as f:
+        config = json.load(f)
+
+    queries = QUERIES
+    if args.queries:
+        with open(args.queries) as f:
+            queries = json.load(f)
+
+    results = benchmark(dir, config, queries)
+    with open(args.output, "w") as f:
+        json.dump({"config": {k: v for k, v in config.items() if k != "chunkNames"}, "queries": results}, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            raise SystemExit(1)
@@ -0,0 +1,144 @@
+"""
+Reads the stream spreadsheet (Joe - Streams.tsv) in one pass for everything that needs it: the
+date export, the youtube fetch and the game facets in data.db.
+
+Rows without a number continue the stream above them (a second game on the same day) and get
+its date. A date that doesn't parse is replaced by the last good one, the same way everywhere.
+"""
+
+import csv
+import urllib.parse as urlparse
+from datetime import date, datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+input_file = "Joe - Streams.tsv"
+DATE_FORMAT = "%a, %m/%d/%Y"
+
+
+class StreamRow(NamedTuple):
+    line: int
+    number: str
+    date: Optional[date]
+    date_parsed: bool
+    game: str
+    part: str
+    video_ids: list
+    cells: list
+
+    @property
+    def continuation(self):
+        return not self.number
+
+
+@lru_cache(maxsize=None)
+def parse_date(value):
+    try:
+        return datetime.strptime(value, DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+
+def video_id_from_url(value):
+    """
+    Examples:
+    - http://youtu.be/SA2iWivDJiE
+    - http://www.youtube.com/watch?v=_oPAwA_Udwc&feature=feedu
+    - http://www.youtube.com/embed/SA2iWivDJiE
+    - http://www.youtube.com/v/SA2iWivDJiE?version=3&amp;hl=en_US
+    """
+    # most cells are game names and numbers, not worth a url parse
+    if "youtu" not in value:
+        return None
+    query = urlparse.urlparse(value)
+    if query.hostname == "youtu.be":
+        return query.path[1:]
+    if query.hostname in ("www.youtube.com", "youtube.com"):
+        if query.path == "/watch":
+            p = urlparse.parse_qs(query.query)
+            return p["v"][0] if "v" in p else None
+        if query.path[:7] == "/embed/":
+            return query.path.split("/")[2]
+        if query.path[:3] == "/v/":
+            return query.path.split("/")[2]
+    # fail?
+    return None
+
+
+def read_streams(file=input_file, warn=True):
+    last_date = None
+    with open(file, "r", newline="", encoding="utf-8") as f:
+        for line, cells in enumerate(csv.reader(f, delimiter="\t"), start=1):
+            if not cells:
+                continue
+            number = cells[0]
+            value = cells[1] if len(cells) > 1 else ""
+            parsed = parse_date(value) if number else None
+            if parsed is not None:
+                last_date = parsed
+            elif number and warn:
+                print(f"Invalid date format in row: {cells}")
+
+            video_ids = []
+            for cell in cells[2:]:
+                video_id = video_id_from_url(cell)
+                if video_id is not None and video_id not in video_ids:
+                    video_ids.append(video_id)
+
+            yield StreamRow(
+                line=line,
+                number=number,
+                date=parsed or last_date,
+                date_parsed=parsed is not None,
+                game=cells[2] if len(cells) > 2 else "",
+                part=cells[3] if len(cells) > 3 else "",
+                video_ids=video_ids,
+                cells=cells,
+            )
+
+
+def create_tables(cursor):
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS streams (
+            line INTEGER PRIMARY KEY,
+            number TEXT,
+            date TEXT,
+            date_parsed INTEGER,
+            game TEXT,
+            part TEXT
+        )
+    """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS stream_videos (
+            video_id TEXT,
+            line INTEGER,
+            PRIMARY KEY (video_id, line)
+        ) WITHOUT ROWID
+    """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS streams_date ON streams (date)")
+
+
+def load_spreadsheet(connection, file=input_file):
+    """
+    Replaces the streams and stream_videos tables with the current spreadsheet, so the rest of
+    the pipeline can join against it instead of reading the tsv again.
+    """
+    cursor = connection.cursor()
+    create_tables(cursor)
+    rows = list(read_streams(file, warn=False))
+    with connection:
+        cursor.execute("DELETE FROM streams")
+        cursor.execute("DELETE FROM stream_videos")
+        cursor.executemany(
+            "INSERT INTO streams (line, number, date, date_parsed, game, part) VALUES (?, ?, ?, ?, ?, ?)",
+            [(row.line, row.number, row.date.isoformat() if row.date else None, row.date_parsed, row.game, row.part) for row in rows],
+        )
+        cursor.executemany(
+            "INSERT INTO stream_videos (video_id, line) VALUES (?, ?)",
+            [(video_id, row.line) for row in rows for video_id in row.video_ids],
+        )
+    return len(rows)
@@ -1,7 +1,10 @@
-import csv
+import argparse
+import gzip
 import json
+import os
 import sqlite3
-import urllib.parse as urlparse
+import time
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import datetime
 from multiprocessing import Pool
@@ -10,8 +13,18 @@ from tqdm.auto import tqdm
 
 import yt_dlp
 
-input_file = "Joe - Streams.tsv"
+from spreadsheet import input_file, read_streams
+
 youtube_datafile = Path("youtube_data.json")
+youtube_indexfile = Path("youtube_index.json")
+VIDEO_ID_LENGTH = 11
+cache_dir = Path("yt_cache")
+CACHE_TTL_DAYS = 30
+
+YT_OPTIONS = {
+    "skip_download": True,
+    "quiet": True,
+}
 
 
 priority = {
@@ -25,17 +38,70 @@ priority = {
 }
 
 
-def get_video(info):
-    date, vod_id = info
-    yt_ops = {
-        "skip_download": True,
-        "quiet": True,
-    }
+# set in each pool worker by init_worker
+extractor = None
+raw_cache = None
+
+
+def make_extractor():
+    return yt_dlp.YoutubeDL(YT_OPTIONS)
+
+
+class RawInfoCache:
+    """
+    The full extract_info response per video, gzipped json in one file per video id, so the
+    stored fields can change without extracting everything again.
+    """
+
+    def __init__(self, dir=cache_dir, ttl_days=CACHE_TTL_DAYS):
+        self.dir = Path(dir)
+        self.ttl = ttl_days * 24 * 3600
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def path(self, video_id):
+        return self.dir / f"{video_id}.json.gz"
+
+    def get(self, video_id, ignore_ttl=False):
+        path = self.path(video_id)
+        try:
+            if not ignore_ttl and time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, EOFError, gzip.BadGzipFile, json.JSONDecodeError):
+            return None
+
+    def put(self, video_id, data):
+        path = self.path(video_id)
+        tmp_path = Path(f"{path}.{os.getpid()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
+
+
+def init_worker(factory=make_extractor, cache=None):
+    global extractor, raw_cache
+    extractor = factory()
+    raw_cache = cache
+
+
+def fetch_info(vod_id):
+    if raw_cache is not None:
+        data = raw_cache.get(vod_id)
+        if data is not None:
+            return data
+
     url = f"https://www.youtube.com/watch?v={vod_id}"
-    with yt_dlp.YoutubeDL(yt_ops) as ydl:
-        data = ydl.extract_info(url, download=False)
+    data = extractor.extract_info(url, download=False)
+    if hasattr(extractor, "sanitize_info"):
+        data = extractor.sanitize_info(data)
+    if raw_cache is not None:
+        raw_cache.put(vod_id, data)
+    return data
 
-    entry = {
+
+def entry_from_info(date, vod_id, data):
+    return {
         "video_id": vod_id,
         "vod_date": date,
         "title": data["title"],
@@ -44,30 +110,21 @@ def get_video(info):
         "duration": data["duration"],
         "channel": data["channel_id"] if "channel_id" in data else "",
     }
-    return entry
 
 
-def video_id_from_url(value):
-    """
-    Examples:
-    - http://youtu.be/SA2iWivDJiE
-    - http://www.youtube.com/watch?v=_oPAwA_Udwc&feature=feedu
-    - http://www.youtube.com/embed/SA2iWivDJiE
-    - http://www.youtube.com/v/SA2iWivDJiE?version=3&amp;hl=en_US
-    """
-    query = urlparse.urlparse(value)
-    if query.hostname == "youtu.be":
-        return query.path[1:]
-    if query.hostname in ("www.youtube.com", "youtube.com"):
-        if query.path == "/watch":
-            p = urlparse.parse_qs(query.query)
-            return p["v"][0]
-        if query.path[:7] == "/embed/":
-            return query.path.split("/")[2]
-        if query.path[:3] == "/v/":
-            return query.path.split("/")[2]
-    # fail?
-    return None
+def get_video(info):
+    date, vod_id = info
+    if extractor is None:
+        init_worker()
+    return entry_from_info(date, vod_id, fetch_info(vod_id))
+
+
+def try_get_video(info):
+    # one bad video shouldn't take the pool down with it
+    try:
+        return info, get_video(info), None
+    except Exception as e:
+        return info, None, f"{type(e).__name__}: {e}"
 
 
 def create_db():
@@ -90,54 +147,122 @@ def create_db():
     """
     )
 
+    # videos whose extraction raised, retried on the next run
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS failed_videos (
+            video_id TEXT PRIMARY KEY,
+            vod_date TEXT,
+            error TEXT,
+            attempts INTEGER,
+            last_attempt TEXT
+        )
+    """
+    )
+
     return connection, cursor
 
 
 def get_youtube_urls():
-    with open(input_file, "r", newline="") as in_file:
-        tsv_reader = csv.reader(in_file, delimiter="\t")
-        youtube_urls = []
-        for row in tsv_reader:
-            if not row[0]:
-                continue
-
-            date_str = row[1]
-            try:
-                # convert the date to the "yyyymmdd" format
-                date_obj = datetime.strptime(date_str, "%a, %m/%d/%Y")
-                formatted_date = date_obj.strftime("%Y%m%d")
-            except ValueError:
-                print(f"Invalid date format in row: {row}")
-
-            for field in row:
-                video_id = video_id_from_url(field)
-                if video_id is not None:
-                    youtube_urls.append((formatted_date, video_id))
+    youtube_urls = []
+    for row in read_streams(input_file):
+        if row.continuation or row.date is None:
+            continue
+        for video_id in row.video_ids:
+            youtube_urls.append((row.date.strftime("%Y%m%d"), video_id))
     return youtube_urls
 
 
-def insert_missing(connection, cursor, youtube_urls):
+VIDEO_INSERT = "INSERT OR IGNORE INTO videos (video_id, vod_date, title, description, upload_date, channel, duration) VALUES (?, ?, ?, ?, ?, ?, ?)"
+VIDEO_REPLACE = VIDEO_INSERT.replace("OR IGNORE", "OR REPLACE")
+
+
+def video_row(entry):
+    return (
+        entry["video_id"],
+        entry["vod_date"],
+        entry["title"],
+        entry["description"],
+        entry["upload_date"],
+        entry["channel"],
+        entry["duration"],
+    )
+
+
+FAILED_UPSERT = """
+    INSERT INTO failed_videos (video_id, vod_date, error, attempts, last_attempt) VALUES (?, ?, ?, 1, ?)
+    ON CONFLICT(video_id) DO UPDATE SET error = excluded.error, attempts = attempts + 1, last_attempt = excluded.last_attempt
+"""
+MAX_ATTEMPTS = 3
+
+
+def write_batch(connection, cursor, entries, failures):
+    with connection:
+        cursor.executemany(VIDEO_INSERT, [video_row(entry) for entry in entries])
+        cursor.executemany("DELETE FROM failed_videos WHERE video_id = ?", [(entry["video_id"],) for entry in entries])
+        now = datetime.now().isoformat(timespec="seconds")
+        cursor.executemany(FAILED_UPSERT, [(vod_id, date, error, now) for (date, vod_id), error in failures])
+
+
+def insert_missing(connection, cursor, youtube_urls, factory=make_extractor, cache=None, workers=8, batch_size=100, batch_seconds=10.0, retry_failed=False):
+    """
+    Extracts every video that isn't in the database yet. Results are written in one
+    transaction per batch_size videos or batch_seconds, whichever comes first, so an interrupted
+    run keeps what it fetched and the next run continues from there. Videos that failed
+    MAX_ATTEMPTS times are skipped unless retry_failed is set.
+    """
     cursor.execute("SELECT video_id FROM videos")
     db_videos = set(row["video_id"] for row in cursor.fetchall())
-    todo_urls = [url for url in youtube_urls if url[1] not in db_videos]
+    if not retry_failed:
+        cursor.execute("SELECT video_id FROM failed_videos WHERE attempts >= ?", (MAX_ATTEMPTS,))
+        db_videos.update(row["video_id"] for row in cursor.fetchall())
+    # a video linked from several rows is fetched once, for the first of them
+    todo = {}
+    for date, vod_id in youtube_urls:
+        if vod_id not in db_videos:
+            todo.setdefault(vod_id, (date, vod_id))
+    todo_urls = list(todo.values())
     if not todo_urls:
         return
 
-    with Pool(8) as pool:
-        for entry in tqdm(pool.imap_unordered(get_video, todo_urls), total=len(todo_urls)):
-            cursor.execute(
-                "INSERT OR IGNORE INTO videos (video_id, vod_date, title, description, upload_date, channel, duration) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (
-                    entry["video_id"],
-                    entry["vod_date"],
-                    entry["title"],
-                    entry["description"],
-                    entry["upload_date"],
-                    entry["channel"],
-                    entry["duration"],
-                ),
-            )
-            connection.commit()
+    entries = []
+    failures = []
+    failed = 0
+    last_write = time.monotonic()
+    with Pool(workers, initializer=init_worker, initargs=(factory, cache)) as pool:
+        try:
+            for info, entry, error in tqdm(pool.imap_unordered(try_get_video, todo_urls), total=len(todo_urls)):
+                if error is None:
+                    entries.append(entry)
+                else:
+                    failures.append((info, error))
+                    failed += 1
+                if len(entries) + len(failures) >= batch_size or time.monotonic() - last_write >= batch_seconds:
+                    write_batch(connection, cursor, entries, failures)
+                    entries, failures = [], []
+                    last_write = time.monotonic()
+        finally:
+            write_batch(connection, cursor, entries, failures)
+
+    if failed:
+        print(f"{failed} videos failed, see the failed_videos table")
+
+
+def rebuild_from_cache(connection, cursor, youtube_urls, cache):
+    """
+    Rewrites the stored fields of every video from its cached response, whatever its age,
+    without extracting anything.
+    """
+    missing = 0
+    for date, vod_id in tqdm(youtube_urls):
+        data = cache.get(vod_id, ignore_ttl=True)
+        if data is None:
+            missing += 1
+            continue
+        cursor.execute(VIDEO_REPLACE, video_row(entry_from_info(date, vod_id, data)))
+    connection.commit()
+    if missing:
+        print(f"{missing} videos are not in the cache")
 
 
 def get_yt_by_date(connection, cursor):
@@ -156,11 +281,81 @@ def get_yt_by_date(connection, cursor):
     return yt_by_date
 
 
+def build_yt_index(cursor):
+    """
+    The videos by date as columns: sorted dates as yyyymmdd numbers, and for the videos of
+    dates[i] the range offsets[i]:offsets[i + 1] of the durations and priorities lists and of
+    the 11 character ids concatenated in video_ids. Within a date videos are in priority order.
+    """
+    cursor.execute("SELECT vod_date, video_id, duration, channel FROM videos WHERE vod_date IS NOT NULL")
+    rows = sorted((int(row["vod_date"]), priority.get(row["channel"], 999), row["video_id"], row["duration"]) for row in cursor)
+
+    dates, offsets, durations, priorities = [], [], [], []
+    video_ids = []
+    for date, video_priority, video_id, duration in rows:
+        if len(video_id) != VIDEO_ID_LENGTH:
+            raise ValueError(f"Unexpected video id {video_id!r}")
+        if not dates or dates[-1] != date:
+            dates.append(date)
+            offsets.append(len(video_ids))
+        video_ids.append(video_id)
+        durations.append(duration)
+        priorities.append(video_priority)
+    offsets.append(len(video_ids))
+
+    return {
+        "dates": dates,
+        "offsets": offsets,
+        "video_ids": "".join(video_ids),
+        "durations": durations,
+        "priorities": priorities,
+    }
+
+
+def write_yt_index(index, file=youtube_indexfile):
+    tmp_file = Path(f"{file}.tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(tmp_file, file)
+
+
+def yt_videos_for_date(index, date):
+    """Same entries as get_yt_by_date()[date], found by binary search over the dates."""
+    date = int(date)
+    i = bisect_left(index["dates"], date)
+    if i == len(index["dates"]) or index["dates"][i] != date:
+        return []
+    return [
+        {
+            "video_id": index["video_ids"][j * VIDEO_ID_LENGTH : (j + 1) * VIDEO_ID_LENGTH],
+            "duration": index["durations"][j],
+            "priority": index["priorities"][j],
+        }
+        for j in range(index["offsets"][i], index["offsets"][i + 1])
+    ]
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--cache-dir", type=Path, default=cache_dir)
+    parser.add_argument("--cache-ttl", type=float, default=CACHE_TTL_DAYS, help="days before a cached response is fetched again")
+    parser.add_argument("--offline", action="store_true", help="rebuild data_yt.db from the cache without extracting anything")
+    parser.add_argument("--batch-size", type=int, default=100, help="videos per transaction")
+    parser.add_argument("--retry-failed", action="store_true", help=f"also retry videos that failed {MAX_ATTEMPTS} times")
+    parser.add_argument("--legacy-json", action="store_true", help=f"also write the old {youtube_datafile}")
+    args = parser.parse_args()
+
+    cache = RawInfoCache(args.cache_dir, args.cache_ttl)
     youtube_urls = get_youtube_urls()
     connection, cursor = create_db()
-    insert_missing(connection, cursor, youtube_urls)
-    yt_by_date = get_yt_by_date(connection, cursor)
+    if args.offline:
+        rebuild_from_cache(connection, cursor, youtube_urls, cache)
+    else:
+        insert_missing(connection, cursor, youtube_urls, cache=cache, workers=args.workers, batch_size=args.batch_size, retry_failed=args.retry_failed)
+    write_yt_index(build_yt_index(cursor))
 
-    with open(youtube_datafile, "w") as f:
-        json.dump(yt_by_date, f, indent=4, sort_keys=True, default=str)
+    if args.legacy_json:
+        yt_by_date = get_yt_by_date(connection, cursor)
+        with open(youtube_datafile, "w") as f:
+            json.dump(yt_by_date, f, indent=4, sort_keys=True, default=str)
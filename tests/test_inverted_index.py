@@ -0,0 +1,57 @@
+import sqlite3
+
+import pytest
+
+from inverted_index import PositionalIndex, write_positional_index
+
+VODS = {
+    "a": ("2020-01-01", ["the boss is here and the chat is happy", "we fight the dark", "souls boss now"]),
+    "b": ("2020-01-02", ["hello chat", "dark souls is hard"]),
+    "c": ("2020-01-03", ["boss fight", "one two three four five chat"]),
+}
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    dir = tmp_path_factory.mktemp("positions")
+    connection = sqlite3.connect(dir / "publish.db")
+    connection.execute("CREATE TABLE vods (vod_id TEXT PRIMARY KEY, date TEXT)")
+    connection.execute("CREATE TABLE transcripts (vod TEXT, sub_index INTEGER, content TEXT)")
+    for vod_id, (date, lines) in VODS.items():
+        connection.execute("INSERT INTO vods VALUES (?, ?)", (vod_id, date))
+        connection.executemany("INSERT INTO transcripts VALUES (?, ?, ?)", [(vod_id, i, line) for i, line in enumerate(lines, 1)])
+    connection.commit()
+    connection.close()
+    manifest_name = write_positional_index(dir / "publish.db", dir / "index")
+    return PositionalIndex(dir / "index", manifest_name)
+
+
+def test_same_cue_is_returned_once(index):
+    assert index.search("the") == [("a", 1, 1), ("a", 2, 2)]
+
+
+def test_phrase_across_cue_boundary(index):
+    assert index.search('"dark souls"') == [("a", 2, 3), ("b", 2, 2)]
+    assert index.search('"souls boss"') == [("a", 3, 3)]
+    assert index.search('"boss souls"') == []
+
+
+def test_near(index):
+    assert index.search("boss NEAR/1 chat") == []
+    assert index.search("boss NEAR/4 chat") == [("a", 1, 1)]
+    assert index.search("chat NEAR/4 boss") == [("a", 1, 1)]
+    assert index.search("boss NEAR chat") == [("a", 1, 1), ("a", 1, 3), ("c", 1, 2)]
+
+
+def test_boolean_operators(index):
+    assert index.search("boss AND chat") == [("a", 1, 1), ("a", 3, 3), ("c", 1, 1), ("c", 2, 2)]
+    assert index.search("boss chat") == index.search("boss AND chat")
+    assert index.search("dark OR hello") == [("a", 2, 2), ("b", 1, 1), ("b", 2, 2)]
+    assert index.search("boss NOT souls") == [("c", 1, 1)]
+    assert index.search("(hello OR fight) AND souls") == [("a", 2, 2), ("a", 3, 3), ("b", 1, 1), ("b", 2, 2)]
+
+
+@pytest.mark.parametrize("query", ["boss AND", "OR chat", "boss NOT", "NEAR chat", "boss NEAR", "(boss", "boss )", "()", "boss AND OR chat"])
+def test_malformed_queries_raise(index, query):
+    with pytest.raises(ValueError):
+        index.search(query)
@@ -0,0 +1,112 @@
+import os
+import time
+import uuid
+from functools import partial
+
+import pytest
+
+pytest.importorskip("yt_dlp")
+import spreadsheet_get_ytdata as yt
+
+VIDEO_IDS = [f"video{i:06d}" for i in range(12)]
+YOUTUBE_URLS = [(f"202001{i % 28 + 1:02d}", video_id) for i, video_id in enumerate(VIDEO_IDS)]
+
+
+class StubExtractor:
+    def __init__(self, title="stub"):
+        self.title = title
+
+    def extract_info(self, url, download=False):
+        video_id = url.rsplit("=", 1)[1]
+        return {"title": f"{self.title} {video_id}", "description": "", "upload_date": "20200101", "duration": 60, "channel_id": "UC8Ru3ISus2XZig4kE2F7ukA"}
+
+
+class FailingExtractor:
+    def extract_info(self, url, download=False):
+        raise AssertionError(f"extract_info called for {url}")
+
+
+def counting_factory(marker_dir, title="stub"):
+    # one marker file per extractor built, so the test can count them across processes
+    (marker_dir / f"{os.getpid()}-{uuid.uuid4().hex}").touch()
+    return StubExtractor(title)
+
+
+def failing_factory():
+    return FailingExtractor()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    connection, cursor = yt.create_db()
+    yield connection, cursor
+    connection.close()
+
+
+def titles(cursor):
+    cursor.execute("SELECT video_id, title FROM videos")
+    return {row["video_id"]: row["title"] for row in cursor.fetchall()}
+
+
+def test_one_extractor_per_worker(db, tmp_path):
+    connection, cursor = db
+    markers = tmp_path / "markers"
+    markers.mkdir()
+    yt.insert_missing(connection, cursor, YOUTUBE_URLS, factory=partial(counting_factory, markers), workers=3)
+
+    assert len(titles(cursor)) == len(VIDEO_IDS)
+    built = list(markers.iterdir())
+    assert len(built) == 3
+    assert len({name.name.split("-")[0] for name in built}) == 3
+
+
+def test_cached_responses_are_not_extracted_again(db, tmp_path):
+    connection, cursor = db
+    cache = yt.RawInfoCache(tmp_path / "cache")
+    markers = tmp_path / "markers"
+    markers.mkdir()
+    yt.insert_missing(connection, cursor, YOUTUBE_URLS, factory=partial(counting_factory, markers), cache=cache, workers=2)
+    assert all(cache.path(video_id).exists() for video_id in VIDEO_IDS)
+
+    with connection:
+        cursor.execute("DELETE FROM videos")
+    yt.insert_missing(connection, cursor, YOUTUBE_URLS, factory=failing_factory, cache=cache, workers=2)
+
+    assert titles(cursor) == {video_id: f"stub {video_id}" for video_id in VIDEO_IDS}
+    cursor.execute("SELECT count(*) FROM failed_videos")
+    assert cursor.fetchone()[0] == 0
+
+
+def test_expired_cache_entries_are_fetched_again(tmp_path):
+    cache = yt.RawInfoCache(tmp_path / "cache", ttl_days=1)
+    cache.put("video000000", {"title": "old"})
+    assert cache.get("video000000") == {"title": "old"}
+
+    two_days_ago = time.time() - 2 * 24 * 3600
+    os.utime(cache.path("video000000"), (two_days_ago, two_days_ago))
+    assert cache.get("video000000") is None
+    assert cache.get("video000000", ignore_ttl=True) == {"title": "old"}
+
+    yt.init_worker(partial(StubExtractor, "fresh"), cache)
+    try:
+        entry = yt.get_video(("20200101", "video000000"))
+    finally:
+        yt.init_worker(failing_factory, None)
+    assert entry["title"] == "fresh video000000"
+    assert cache.get("video000000")["title"] == "fresh video000000"
+
+
+def test_offline_rebuild_uses_only_the_cache(db, tmp_path):
+    connection, cursor = db
+    cache = yt.RawInfoCache(tmp_path / "cache", ttl_days=0)
+    for video_id in VIDEO_IDS[:-1]:
+        cache.put(video_id, {"title": f"cached {video_id}", "description": "", "upload_date": "20200101", "duration": 60})
+    with connection:
+        cursor.execute(yt.VIDEO_INSERT, ("video000000", "20200101", "stale", "", "", "", 1))
+
+    yt.init_worker(failing_factory, None)
+    yt.rebuild_from_cache(connection, cursor, YOUTUBE_URLS, cache)
+
+    # expired entries are still used offline, the uncached video is left out
+    assert titles(cursor) == {video_id: f"cached {video_id}" for video_id in VIDEO_IDS[:-1]}